@@ -5,20 +5,76 @@ This module contains the controller for managing backtest execution,
 including progress monitoring, error handling, and results management.
 """
 
-from typing import Optional, Dict, Any, List
-from PySide6.QtCore import QObject, Signal, QThread, QTimer
+import datetime
+from enum import IntEnum
+from numbers import Number
+from typing import Optional, Dict, Any, List, Tuple
+from PySide6.QtCore import (
+    QObject,
+    QRunnable,
+    Qt,
+    Signal,
+    Slot,
+    QThread,
+    QThreadPool,
+    QTimer,
+)
 from PySide6.QtWidgets import QMessageBox
+import pandas as pd
 
 from ..models.backtest_model import BacktestModel
 from ...engine import Engine, BacktestParameters
 from ...strategy import TradingStrategy
 from ...trades import TradeRegistry
 
+try:
+    import xlsxwriter
+
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    # xlsxwriter is optional; Excel export is then unavailable
+    XLSXWRITER_AVAILABLE = False
+
+# Live metric titles shown by the execution monitor, in display order
+LIVE_METRIC_TITLES = (
+    "Current P&L",
+    "Total Trades",
+    "Win Rate",
+    "Max DD",
+    "Current DD",
+    "Profit Factor",
+)
+
+
+# Cell values xlsxwriter writes natively; anything else is exported as text
+_XLSX_NATIVE_TYPES = (str, Number, datetime.date, datetime.time, datetime.timedelta)
+
+
+def _xlsx_cell(value: Any) -> Any:
+    """Return a trades value in a form xlsxwriter can write to a cell."""
+    # None, NaN, NaT and pd.NA become blank cells
+    if value is None or (pd.api.types.is_scalar(value) and pd.isna(value)):
+        return None
+    return value if isinstance(value, _XLSX_NATIVE_TYPES) else str(value)
+
+
+class LiveMetric(IntEnum):
+    """Position of each live metric in LIVE_METRIC_TITLES and metrics tuples."""
+
+    PNL = 0
+    TRADES = 1
+    WIN_RATE = 2
+    MAX_DD = 3
+    CUR_DD = 4
+    PF = 5
+
 
 class BacktestExecutionThread(QThread):
     """Thread for executing backtests to avoid blocking the UI."""
 
     backtest_finished = Signal(object)  # TradeRegistry results
+    metrics_ready = Signal(tuple)  # formatted live metrics, in LiveMetric order
+    kpis_ready = Signal(list)  # formatted results tab KPI groups
     backtest_error = Signal(str)  # error message
     progress_updated = Signal(int)  # progress percentage
     status_updated = Signal(str)  # status message
@@ -75,6 +131,10 @@ class BacktestExecutionThread(QThread):
 
             self.progress_updated.emit(100)
             self.status_updated.emit("Backtest completed")
+            self.metrics_ready.emit(self._format_live_metrics(results))
+            kpi_groups = self._build_kpi_groups(results)
+            if kpi_groups is not None:
+                self.kpis_ready.emit(kpi_groups)
             self.backtest_finished.emit(results)
 
         except Exception as e:
@@ -88,6 +148,113 @@ class BacktestExecutionThread(QThread):
         """Request the backtest to stop."""
         self._should_stop = True
 
+    def _format_live_metrics(self, results: TradeRegistry) -> Tuple[str, ...]:
+        """Format the live metrics in this thread so the GUI only sets text."""
+        try:
+            drawdown = results._compute_maximum_drawdown()
+            # Positional, in LiveMetric order
+            return (
+                f"{results.net_balance:.2f}",
+                str(len(results.trades)),
+                f"{results.accuracy:.1f}%",
+                f"{drawdown.get('maximum_drawdown', 0):.2f}",
+                "0.00",  # TODO: Calculate current drawdown
+                f"{results.profit_factor:.2f}",
+            )
+        except Exception:
+            return ("—",) * len(LIVE_METRIC_TITLES)
+
+    def _build_kpi_groups(self, results: TradeRegistry) -> Optional[List[tuple]]:
+        """Compile and format the results tab KPIs in this thread."""
+        try:
+            from src.visualizer.models import BacktestResultModel
+
+            return BacktestResultModel(registry=results).kpi_groups
+        except Exception as e:
+            print(f"[BacktestExecutionThread] Error building KPI groups: {e}")
+            return None
+
+
+def _write_results(
+    trades, summary: Optional[Dict[str, Any]], file_path: str, format: str
+) -> bool:
+    """Write exported results to file_path; safe to call off the GUI thread."""
+    try:
+        if format.lower() == "csv":
+            # DataFrame.to_csv writes the whole trades frame in one go
+            trades.to_csv(file_path, index=False)
+        elif format.lower() == "json":
+            import json
+
+            if summary:
+                # Encode once and write once rather than streaming small chunks
+                payload = json.dumps(summary, indent=2, default=str)
+                with open(file_path, 'w') as f:
+                    f.write(payload)
+        elif format.lower() in ("xlsx", "excel"):
+            if not XLSXWRITER_AVAILABLE:
+                print(
+                    "Error exporting results: Excel export requires the "
+                    "'xlsxwriter' package (pip install xlsxwriter)"
+                )
+                return False
+            _write_trades_xlsx(trades, file_path)
+        else:
+            return False
+
+        return True
+    except Exception as e:
+        print(f"Error exporting results: {e}")
+        return False
+
+
+def _write_trades_xlsx(trades, file_path: str) -> None:
+    """Write the trades table to an xlsx workbook one row at a time."""
+    options = {
+        # Rows are flushed to disk as they are written, keeping memory flat
+        'constant_memory': True,
+        'use_zip64': True,
+        'nan_inf_to_errors': True,
+        'remove_timezone': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+    }
+    with xlsxwriter.Workbook(file_path, options) as workbook:
+        sheet = workbook.add_worksheet("Trades")
+        sheet.write_row(0, 0, [str(column) for column in trades.columns])
+        for row, values in enumerate(trades.itertuples(index=False), start=1):
+            sheet.write_row(row, 0, [_xlsx_cell(value) for value in values])
+
+
+class ExportWorkerSignals(QObject):
+    """Signals emitted by ExportWorker (QRunnable cannot define signals)."""
+
+    export_done = Signal(bool, str)  # success, file path
+
+
+class ExportWorker(QRunnable):
+    """Writes a snapshot of backtest results to a file on a thread pool."""
+
+    def __init__(
+        self,
+        trades,
+        summary: Optional[Dict[str, Any]],
+        file_path: str,
+        format: str,
+    ):
+        super().__init__()
+        self.trades = trades
+        self.summary = summary
+        self.file_path = file_path
+        self.format = format
+        self.signals = ExportWorkerSignals()
+
+    def run(self):
+        """Export the results and report the outcome to the GUI thread."""
+        success = _write_results(self.trades, self.summary, self.file_path, self.format)
+        # Do not keep the results alive through a finished worker
+        self.trades = self.summary = None
+        self.signals.export_done.emit(success, self.file_path)
+
 
 class ExecutionController(QObject):
     """
@@ -128,6 +295,7 @@ class ExecutionController(QObject):
         backtest_error(str): Emitted when backtest encounters an error (error_message)
         progress_updated(int): Emitted with progress updates (percentage)
         status_updated(str): Emitted with status message updates (message)
+        metrics_ready(tuple): Emitted with pre-formatted live metrics (LiveMetric order)
 
     Example:
         ```python
@@ -147,13 +315,20 @@ class ExecutionController(QObject):
     backtest_error = Signal(str)  # error message
     progress_updated = Signal(int)  # progress percentage
     status_updated = Signal(str)  # status message
+    metrics_ready = Signal(tuple)  # formatted live metrics, in LiveMetric order
+    export_finished = Signal(bool, str)  # success, file path
 
     def __init__(self, backtest_model: BacktestModel, parent=None):
         super().__init__(parent)
         self.backtest_model = backtest_model
         self._execution_thread: Optional[BacktestExecutionThread] = None
         self._current_results: Optional[TradeRegistry] = None
+        self._current_kpis: Optional[List[tuple]] = None
         self._is_running = False
+        # Last progress and status forwarded, so repeats are dropped
+        self._last_progress: Optional[int] = None
+        self._last_status: Optional[str] = None
+        self._export_worker: Optional[ExportWorker] = None
 
         # Progress monitoring timer
         self._progress_timer = QTimer()
@@ -186,12 +361,21 @@ class ExecutionController(QObject):
                 return False
 
             # Start execution thread
-            self._execution_thread = BacktestExecutionThread(strategy, data, config)
-            self._execution_thread.backtest_finished.connect(self._on_backtest_finished)
-            self._execution_thread.backtest_error.connect(self._on_backtest_error)
-            self._execution_thread.progress_updated.connect(self._on_progress_updated)
-            self._execution_thread.status_updated.connect(self._on_status_updated)
-
+            # Worker signals are always delivered through the GUI event loop
+            thread = BacktestExecutionThread(strategy, data, config)
+            queued = Qt.QueuedConnection
+            thread.backtest_finished.connect(self._on_backtest_finished, queued)
+            thread.backtest_error.connect(self._on_backtest_error, queued)
+            thread.metrics_ready.connect(self._on_metrics_ready, queued)
+            thread.kpis_ready.connect(self._on_kpis_ready, queued)
+            thread.progress_updated.connect(self._on_progress_updated, queued)
+            thread.status_updated.connect(self._on_status_updated, queued)
+            self._execution_thread = thread
+
+            # KPI groups always belong to the results of the latest run
+            self._current_kpis = None
+            self._last_progress = None
+            self._last_status = None
             self._is_running = True
             self._execution_thread.start()
             self._progress_timer.start()
@@ -226,6 +410,11 @@ class ExecutionController(QObject):
         """Get the results from the last completed backtest."""
         return self._current_results
 
+    def get_current_kpis(self) -> Optional[List[tuple]]:
+        """Get the formatted KPI groups of the current results."""
+        return self._current_kpis
+
+    @Slot(object)
     def _on_backtest_finished(self, results: TradeRegistry):
         """Handle backtest completion."""
         self._current_results = results
@@ -237,6 +426,7 @@ class ExecutionController(QObject):
 
         self.backtest_finished.emit(results)
 
+    @Slot(str)
     def _on_backtest_error(self, error_message: str):
         """Handle backtest errors."""
         self._is_running = False
@@ -247,14 +437,31 @@ class ExecutionController(QObject):
 
         self.backtest_error.emit(error_message)
 
+    @Slot(tuple)
+    def _on_metrics_ready(self, metrics: Tuple[str, ...]):
+        """Handle pre-formatted live metrics from the execution thread."""
+        self.metrics_ready.emit(metrics)
+
+    @Slot(list)
+    def _on_kpis_ready(self, kpi_groups: List[tuple]):
+        """Handle KPI groups formatted by the execution thread."""
+        self._current_kpis = kpi_groups
+
+    @Slot(int)
     def _on_progress_updated(self, progress: int):
-        """Handle progress updates."""
-        self.progress_updated.emit(progress)
+        """Forward progress updates, dropping repeats of the last value."""
+        if progress != self._last_progress:
+            self._last_progress = progress
+            self.progress_updated.emit(progress)
 
+    @Slot(str)
     def _on_status_updated(self, status: str):
-        """Handle status updates."""
-        self.status_updated.emit(status)
+        """Forward status updates, dropping repeats of the last message."""
+        if status != self._last_status:
+            self._last_status = status
+            self.status_updated.emit(status)
 
+    @Slot()
     def _update_progress(self):
         """Update progress during backtest execution."""
         # This is a placeholder for more sophisticated progress monitoring
@@ -280,24 +487,35 @@ class ExecutionController(QObject):
         if not self._current_results:
             return False
 
-        try:
-            if format.lower() == "csv":
-                self._current_results.trades.to_csv(file_path, index=False)
-            elif format.lower() == "json":
-                import json
-
-                results = self.get_backtest_summary()
-                if results:
-                    with open(file_path, 'w') as f:
-                        json.dump(results, f, indent=2, default=str)
-            else:
-                return False
+        return _write_results(*self._export_snapshot(format), file_path, format)
 
-            return True
-        except Exception as e:
-            print(f"Error exporting results: {e}")
+    def export_results_async(self, file_path: str, format: str = "csv") -> bool:
+        """Start exporting results on the thread pool; export_finished reports it."""
+        if not self._current_results or self._export_worker is not None:
             return False
 
+        # The worker only sees this snapshot, never the controller's state
+        worker = ExportWorker(*self._export_snapshot(format), file_path, format)
+        worker.signals.export_done.connect(self._on_export_done)
+        self._export_worker = worker
+        QThreadPool.globalInstance().start(worker)
+        return True
+
+    def _export_snapshot(self, format: str) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Return the trades frame and, for JSON, the summary of the results."""
+        summary = self.get_backtest_summary() if format.lower() == "json" else None
+        return self._current_results.trades, summary
+
+    def is_exporting(self) -> bool:
+        """Check if an export is currently running."""
+        return self._export_worker is not None
+
+    @Slot(bool, str)
+    def _on_export_done(self, success: bool, file_path: str):
+        """Release the finished export worker and forward its outcome."""
+        self._export_worker = None
+        self.export_finished.emit(success, file_path)
+
     def get_trade_statistics(self) -> Optional[Dict[str, Any]]:
         """Get detailed trade statistics."""
         if not self._current_results:
@@ -355,4 +573,6 @@ class ExecutionController(QObject):
 
     def clear_results(self):
         """Clear the current backtest results."""
-        self._current_results = None
+        if self._current_results is not None:
+            self._current_results = None
+            self._current_kpis = None
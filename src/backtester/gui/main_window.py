@@ -22,7 +22,10 @@ from PySide6.QtWidgets import (
 )
 
 from src.helper import PROJECT_ROOT
-from .controllers.execution_controller import ExecutionController
+from .controllers.execution_controller import (
+    XLSXWRITER_AVAILABLE,
+    ExecutionController,
+)
 from .controllers.strategy_controller import StrategyController
 from .models.backtest_model import BacktestModel
 from .models.strategy_model import StrategyModel
@@ -54,7 +57,8 @@ class BacktesterMainWindow(QMainWindow):
         execution_controller (ExecutionController): Manages backtest execution
         tab_widget (QTabWidget): Main tabbed interface container
         strategy_builder (StrategyBuilderWidget): Strategy composition interface
-        data_config (DataConfigWidget): Data loading and configuration interface
+        data_config (DataConfigWidget): Data loading and configuration interface,
+            None until its tab is first shown
         backtest_config (BacktestConfigWidget): Parameter configuration interface
         execution_monitor (ExecutionMonitorWidget): Real-time execution monitoring
 
@@ -160,7 +164,16 @@ class BacktesterMainWindow(QMainWindow):
 
         Each tab widget is connected to its respective model and controller
         to maintain proper MVC separation and data flow.
+
+        The data configuration tab is built the first time it is shown and then
+        catches up with data already loaded into the model. The backtest
+        configuration tab is built upfront because it writes its defaults into
+        the model, and the execution monitor because it follows the execution
+        controller's signals.
         """
+        # Host page -> builder of the widget it shows, for tabs not built yet
+        self._tab_builders = {}
+
         # Strategy Builder Tab
         self.strategy_builder = StrategyBuilderWidget(
             self.strategy_model, self.strategy_controller
@@ -168,8 +181,8 @@ class BacktesterMainWindow(QMainWindow):
         self.tab_widget.addTab(self.strategy_builder, "Strategy Builder")
 
         # Data Configuration Tab
-        self.data_config = DataConfigWidget(self.backtest_model)
-        self.tab_widget.addTab(self.data_config, "Data Configuration")
+        self.data_config = None
+        self._add_lazy_tab(self._create_data_config, "Data Configuration")
 
         # Backtest Configuration Tab
         self.backtest_config = BacktestConfigWidget(self.backtest_model)
@@ -181,6 +194,26 @@ class BacktesterMainWindow(QMainWindow):
         )
         self.tab_widget.addTab(self.execution_monitor, "Execution & Monitoring")
 
+    def _add_lazy_tab(self, builder, title: str):
+        """Add an empty host page whose widget is built when first shown."""
+        host = QWidget()
+        QVBoxLayout(host).setContentsMargins(0, 0, 0, 0)
+        self._tab_builders[host] = builder
+        self.tab_widget.addTab(host, title)
+
+    def _build_tab(self, index: int):
+        """Build the widget of a lazy tab page, if it has not been built yet."""
+        builder = self._tab_builders.pop(self.tab_widget.widget(index), None)
+        if builder is not None:
+            self.tab_widget.widget(index).layout().addWidget(builder())
+
+    def _create_data_config(self) -> DataConfigWidget:
+        """Create the data configuration widget."""
+        self.data_config = DataConfigWidget(self.backtest_model)
+        # Show data loaded into the model before the tab was first opened
+        self.data_config.sync_loaded_data()
+        return self.data_config
+
     def _create_menu_bar(self):
         """Create the application menu bar."""
         menubar = self.menuBar()
@@ -355,6 +388,7 @@ class BacktesterMainWindow(QMainWindow):
         self.execution_controller.backtest_finished.connect(self._on_backtest_finished)
         self.execution_controller.backtest_error.connect(self._on_backtest_error)
         self.execution_controller.progress_updated.connect(self._on_progress_updated)
+        self.execution_controller.export_finished.connect(self._on_export_finished)
 
     def _apply_styling(self):
         """Apply JetBrains-inspired dark theme styling to the application."""
@@ -381,6 +415,8 @@ class BacktesterMainWindow(QMainWindow):
 
     def _on_tab_changed(self, index: int):
         """Handle tab change events."""
+        self._build_tab(index)
+
         tab_names = [
             "Strategy Builder",
             "Data Configuration",
@@ -583,11 +619,76 @@ class BacktesterMainWindow(QMainWindow):
 
     def _export_results(self):
         """Export backtest results."""
-        # TODO: Implement export functionality
-        QMessageBox.information(
-            self, "Export Results", "Export results functionality to be implemented"
+        if not self.execution_controller.get_current_results():
+            QMessageBox.warning(
+                self, "No Results", "Please run a backtest before exporting results."
+            )
+            return
+
+        if self.execution_controller.is_running():
+            QMessageBox.warning(
+                self, "Backtest Running", "Please wait for the backtest to finish."
+            )
+            return
+
+        if self.execution_controller.is_exporting():
+            QMessageBox.warning(
+                self, "Export Running", "Please wait for the current export to finish."
+            )
+            return
+
+        from PySide6.QtWidgets import QFileDialog
+
+        # Excel export is only offered when the optional xlsxwriter is installed
+        filters = ["CSV Files (*.csv)", "JSON Files (*.json)"]
+        if XLSXWRITER_AVAILABLE:
+            filters.append("Excel Files (*.xlsx)")
+
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Export Results", "backtest_results.csv", ";;".join(filters)
         )
 
+        if not file_path:
+            return  # User cancelled
+
+        # Prefer the typed extension, falling back to the selected filter
+        extension = os.path.splitext(file_path)[1].lower().lstrip('.')
+        if extension == "xlsx" and not XLSXWRITER_AVAILABLE:
+            QMessageBox.critical(
+                self,
+                "Export Error",
+                "Excel export requires the 'xlsxwriter' package.\n"
+                "Install it with: pip install xlsxwriter",
+            )
+            return
+        if extension not in ("csv", "json", "xlsx"):
+            extension = selected_filter.rsplit('.', 1)[-1].rstrip(')')
+            file_path += f".{extension}"
+
+        # The file is written off the GUI thread; _on_export_finished reports it
+        if self.execution_controller.export_results_async(file_path, extension):
+            self._update_status(f"Exporting results to {file_path}...")
+            self.progress_bar.setRange(0, 0)
+            self.progress_bar.setVisible(True)
+
+    def _on_export_finished(self, success: bool, file_path: str):
+        """Handle export completion."""
+        self.progress_bar.setVisible(False)
+        self.progress_bar.setRange(0, 100)
+
+        if success:
+            self._update_status(f"Results exported to {file_path}")
+            QMessageBox.information(
+                self,
+                "Export Results",
+                f"Results exported successfully to:\n{file_path}",
+            )
+        else:
+            self._update_status("Export failed")
+            QMessageBox.critical(
+                self, "Export Error", f"Failed to export results to:\n{file_path}"
+            )
+
     def _run_backtest(self):
         """
         Run the backtest with current configuration.
@@ -237,14 +237,14 @@ class Theme:
     def get_form_stylesheet(cls) -> str:
         """Get form input stylesheet."""
         return f"""
-            QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QTextEdit, QDateEdit {{
+            QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QTextEdit, QPlainTextEdit, QDateEdit {{
                 background-color: {cls.BACKGROUND_INPUT};
                 color: {cls.TEXT_PRIMARY};
                 border: 1px solid {cls.BORDER_DEFAULT};
                 border-radius: 3px;
                 padding: 4px;
             }}
-            QLineEdit:focus, QComboBox:focus, QSpinBox:focus, QDoubleSpinBox:focus, QTextEdit:focus, QDateEdit:focus {{
+            QLineEdit:focus, QComboBox:focus, QSpinBox:focus, QDoubleSpinBox:focus, QTextEdit:focus, QPlainTextEdit:focus, QDateEdit:focus {{
                 border-color: {cls.BORDER_FOCUS};
             }}
             QComboBox::drop-down {{
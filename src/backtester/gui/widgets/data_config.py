@@ -5,6 +5,9 @@ This module contains the interface for loading and configuring market data,
 including data source selection, validation, and preview functionality.
 """
 
+import sys
+import weakref
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
 from PySide6.QtWidgets import (
     QWidget,
@@ -17,8 +20,7 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QDateEdit,
     QSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTabWidget,
     QTextEdit,
     QProgressBar,
@@ -31,13 +33,315 @@ from PySide6.QtWidgets import (
     QAbstractItemView,
     QScrollArea,
 )
-from PySide6.QtCore import Qt, Signal, QDate, QTimer
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    QDate,
+    QTimer,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QAbstractTableModel,
+    QModelIndex,
+)
 from PySide6.QtGui import QFont
+import numpy as np
 import pandas as pd
 
 from ..models.backtest_model import BacktestModel, DataSourceConfig
 from src.data import CandleData, TickData
 
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba is optional; missing values are then counted with pandas
+    NUMBA_AVAILABLE = False
+
+# Column names (lowercase) that identify a frame as candle data
+_OHLC = frozenset(map(sys.intern, ('open', 'high', 'low', 'close')))
+
+# OHLC column names (lowercase) across the supported data languages
+OHLC_COLUMNS = frozenset(
+    map(
+        sys.intern,
+        (
+            # English
+            'open',
+            'high',
+            'low',
+            'close',
+            # Portuguese
+            'abertura',
+            'maxima',
+            'minima',
+            'fechamento',
+            # Spanish
+            'apertura',
+            'maximo',
+            'minimo',
+            'cierre',
+            # French
+            'ouverture',
+            'haut',
+            'bas',
+            'fermeture',
+        ),
+    )
+)
+
+# Rules used in the statistics summary text
+_SUMMARY_SEP = "=" * 50
+_SEP = "-" * 30
+
+# Sentinel for optional attributes probed with getattr()
+_MISSING = object()
+
+# Wrapper classes and the data type label each one maps to
+_TYPE_DISPATCH = ((CandleData, 'candle'), (TickData, 'tick'))
+
+# Detected data type per loaded object, keyed by id() and evicted on collection
+_DATA_TYPE_CACHE: Dict[int, str] = {}
+
+
+@dataclass(slots=True)
+class DataStats:
+    """Summary statistics of a loaded DataFrame, computed once after loading."""
+
+    rows: int
+    columns: tuple
+    dmin: Optional[str]
+    dmax: Optional[str]
+    missing: int
+
+
+# Summary statistics per loaded DataFrame, keyed by id() and evicted on collection
+_DATA_STATS_CACHE: Dict[int, DataStats] = {}
+
+# (row count, missing value total) per DataFrame, keyed by id() like the above
+_MISSING_COUNT_CACHE: Dict[int, tuple] = {}
+
+# Frames smaller than this (rows * columns) are not worth the JIT compile
+_NUMBA_MIN_CELLS = 1_000_000
+
+if NUMBA_AVAILABLE:
+
+    # Serial on purpose: it is memory-bound, and a parallel kernel must not be
+    # entered concurrently from the GUI thread and StatsWorker threads
+    @njit(cache=True)
+    def _count_nans(values):
+        """Count NaNs in a 1-D float array."""
+        count = 0
+        for i in range(values.shape[0]):
+            if np.isnan(values[i]):
+                count += 1
+        return count
+
+else:
+    _count_nans = None
+
+
+def _fold(col: str) -> str:
+    """Lowercase a column name, reusing it when it is already lowercase ASCII."""
+    return col if col.isascii() and col.islower() else col.lower()
+
+
+def _as_frame(data):
+    """Return the DataFrame behind a loaded data object (or data itself)."""
+    to_frame = getattr(data, 'to_frame', None)
+    return to_frame() if to_frame is not None else data
+
+
+def _detect_data_type(data) -> str:
+    """Return 'candle', 'tick' or 'unknown' for a loaded data object (memoized)."""
+    data_type = _DATA_TYPE_CACHE.get(id(data))
+    if data_type is not None:
+        return data_type
+
+    for data_cls, label in _TYPE_DISPATCH:
+        if isinstance(data, data_cls):
+            data_type = label
+            break
+    else:
+        if hasattr(data, 'columns'):
+            # Check if it has OHLC columns (candle data) - support multiple languages
+            columns = data.columns
+            has_ohlc = pd.api.types.is_string_dtype(columns) and bool(
+                columns.str.lower().isin(OHLC_COLUMNS).any()
+            )
+            data_type = "candle" if has_ohlc else "tick"
+        else:
+            data_type = "unknown"
+
+    try:
+        weakref.finalize(data, _DATA_TYPE_CACHE.pop, id(data), None)
+    except TypeError:
+        # Not weak-referenceable: memoizing by id() could go stale
+        return data_type
+    _DATA_TYPE_CACHE[id(data)] = data_type
+    return data_type
+
+
+def _count_missing(df: pd.DataFrame) -> int:
+    """Return the total number of missing values in df (memoized)."""
+    cached = _MISSING_COUNT_CACHE.get(id(df))
+    if cached is not None and cached[0] == len(df):
+        return cached[1]
+
+    if (
+        _count_nans is not None
+        and df.size >= _NUMBA_MIN_CELLS
+        and all(dtype.kind == 'f' for dtype in df.dtypes)
+    ):
+        # Single pass over the float block without a boolean mask
+        total = int(_count_nans(df.to_numpy(dtype=np.float64).ravel(order='K')))
+    else:
+        total = int(
+            np.add.reduce([col.isna().to_numpy().sum() for _, col in df.items()])
+        )
+    if id(df) not in _MISSING_COUNT_CACHE:
+        weakref.finalize(df, _MISSING_COUNT_CACHE.pop, id(df), None)
+    _MISSING_COUNT_CACHE[id(df)] = (len(df), total)
+    return total
+
+
+def _count_missing_per_column(df: pd.DataFrame) -> np.ndarray:
+    """Return the number of missing values in each column of df."""
+    use_kernel = _count_nans is not None and df.size >= _NUMBA_MIN_CELLS
+    return np.fromiter(
+        (
+            _count_nans(col.to_numpy(dtype=np.float64))
+            if use_kernel and col.dtype.kind == 'f'
+            else col.isna().sum()
+            for _, col in df.items()
+        ),
+        dtype=np.int64,
+        count=df.shape[1],
+    )
+
+
+def _index_range(index: pd.Index) -> tuple:
+    """Return (min, max) of an index, reading the endpoints when it is sorted."""
+    if len(index) and getattr(index, 'is_monotonic_increasing', False):
+        return index[0], index[-1]
+    return index.min(), index.max()
+
+
+def _get_data_stats(df: pd.DataFrame) -> DataStats:
+    """Return the summary statistics of a loaded DataFrame (memoized)."""
+    stats = _DATA_STATS_CACHE.get(id(df))
+    columns = tuple(df.columns.tolist())
+    # Frames that gained rows or changed columns in place are recomputed
+    if stats is not None and stats.rows == len(df) and stats.columns == columns:
+        return stats
+
+    if hasattr(df.index, 'min'):
+        dmin, dmax = (str(bound) for bound in _index_range(df.index))
+    else:
+        dmin = dmax = None
+    stats = DataStats(
+        rows=len(df),
+        columns=columns,
+        dmin=dmin,
+        dmax=dmax,
+        missing=_count_missing(df),
+    )
+    if id(df) not in _DATA_STATS_CACHE:
+        weakref.finalize(df, _DATA_STATS_CACHE.pop, id(df), None)
+    _DATA_STATS_CACHE[id(df)] = stats
+    return stats
+
+
+def _evict_data_stats(df: pd.DataFrame) -> None:
+    """Forget the memoized statistics of df so they are recomputed on next use."""
+    _DATA_STATS_CACHE.pop(id(df), None)
+    _MISSING_COUNT_CACHE.pop(id(df), None)
+
+
+def _wrap_dataframe(df: pd.DataFrame, config: DataSourceConfig):
+    """Wrap a loaded DataFrame in CandleData or TickData based on its columns."""
+    if df.columns.dtype == object:
+        # Intern the labels so lookups against the OHLC key sets hit identity
+        df.columns = pd.Index(
+            [sys.intern(col) if isinstance(col, str) else col for col in df.columns],
+            name=df.columns.name,
+        )
+    # Stops at the first OHLC label, which is usually the first column
+    has_ohlc = any(
+        isinstance(col, str) and _fold(col) in _OHLC for col in df.columns
+    )
+    if has_ohlc:
+        data_obj = CandleData(symbol=config.symbol, timeframe=config.timeframe)
+    else:
+        data_obj = TickData(symbol=config.symbol)
+    data_obj.df = df
+    return data_obj
+
+
+def _format_source_statistics(source_id: str, data) -> str:
+    """Format the statistics block of a single loaded source."""
+    # Determine data type for display
+    data_type = _detect_data_type(data)
+
+    symbol = getattr(data, 'symbol', _MISSING)
+    symbol_line = f"\nSymbol: {symbol}" if symbol is not _MISSING else ""
+    timeframe = getattr(data, 'timeframe', _MISSING)
+    timeframe_line = f"\nTimeframe: {timeframe}" if timeframe is not _MISSING else ""
+
+    # Handle wrapped data objects (CandleData/TickData)
+    df = _as_frame(data)
+
+    frame_lines = ""
+    if hasattr(df, 'columns'):
+        stats = _get_data_stats(df)
+        range_line = (
+            f"\nDate Range: {stats.dmin} to {stats.dmax}"
+            if stats.dmin is not None
+            else ""
+        )
+        frame_lines = (
+            f"\nRows: {stats.rows}"
+            f"\nColumns: {list(stats.columns)}"
+            f"{range_line}"
+            f"\nMissing Values: {stats.missing}"
+        )
+
+    # One formatted block per source
+    return (
+        f"\nSource: {source_id}\n{_SEP}\nData Type: {data_type}"
+        f"{symbol_line}{timeframe_line}{frame_lines}"
+    )
+
+
+class StatsWorkerSignals(QObject):
+    """Signals emitted by StatsWorker (QRunnable cannot define signals)."""
+
+    result_ready = Signal(int, str)  # generation, statistics text
+
+
+class StatsWorker(QRunnable):
+    """Computes the statistics summary of loaded sources on a thread pool."""
+
+    def __init__(self, generation: int, sources: List[tuple]):
+        super().__init__()
+        self.generation = generation
+        self.sources = sources
+        self.signals = StatsWorkerSignals()
+
+    def run(self):
+        """Build the summary text and hand it back to the GUI thread."""
+        try:
+            stats_text = ["Data Sources Summary:", _SUMMARY_SEP]
+            for source_id, data in self.sources:
+                stats_text.append(_format_source_statistics(source_id, data))
+            text = "\n".join(stats_text)
+        except Exception as e:
+            text = f"Error computing statistics: {str(e)}"
+        # Do not keep the loaded frames alive through a finished worker
+        self.sources = None
+        self.signals.result_ready.emit(self.generation, text)
+
 
 class DataSourceWidget(QWidget):
     """
@@ -82,6 +386,9 @@ class DataSourceWidget(QWidget):
     load_requested = Signal(str)  # source_id - emitted when user clicks Load Data
     source_removed = Signal(str)  # source_id
 
+    # Combined stylesheet shared by every instance (built lazily by _style)
+    _CACHED_STYLE: Optional[str] = None
+
     def __init__(self, source_id: str, config: DataSourceConfig, parent=None):
         super().__init__(parent)
         self.source_id = source_id
@@ -198,15 +505,23 @@ class DataSourceWidget(QWidget):
         # Update visibility based on source type
         self._update_ui_visibility()
 
+    @classmethod
+    def _style(cls) -> str:
+        """Return the combined stylesheet, assembling it on first use only."""
+        if cls._CACHED_STYLE is None:
+            from ..theme import theme
+
+            cls._CACHED_STYLE = (
+                theme.get_widget_base_stylesheet()
+                + theme.get_groupbox_stylesheet()
+                + theme.get_form_stylesheet()
+                + theme.get_button_stylesheet("primary")
+            )
+        return cls._CACHED_STYLE
+
     def _apply_styling(self):
         """Apply JetBrains-inspired styling to the widget."""
-        from ..theme import theme
-        self.setStyleSheet(
-            theme.get_widget_base_stylesheet() +
-            theme.get_groupbox_stylesheet() +
-            theme.get_form_stylesheet() +
-            theme.get_button_stylesheet("primary")
-        )
+        self.setStyleSheet(DataSourceWidget._style())
 
     def _on_source_type_changed(self, source_type: str):
         """Handle source type changes."""
@@ -268,9 +583,85 @@ class DataSourceWidget(QWidget):
         return self.config
 
 
+class DataFrameTableModel(QAbstractTableModel):
+    """
+    Read-only model showing the cells of a DataFrame as centered text.
+
+    Rows are formatted in chunks of FETCH_ROWS as the view scrolls towards them,
+    so a large frame costs no more to show than its first chunk.
+    """
+
+    FETCH_ROWS = 500
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._df: Optional[pd.DataFrame] = None
+        self._headers: List[str] = []
+        # Text of the fetched cells, one list per column, indexed by data()
+        self._columns: List[List[str]] = []
+        self._row_count = 0
+
+    def set_frame(self, df: Optional[pd.DataFrame]):
+        """Show a new frame, or nothing when df is None."""
+        self.beginResetModel()
+        self._df = df
+        self._headers = [] if df is None else [str(col) for col in df.columns]
+        self._columns = [[] for _ in self._headers]
+        self._row_count = 0
+        self._append_rows(self.FETCH_ROWS)
+        self.endResetModel()
+
+    def _append_rows(self, count: int):
+        """Format the next rows of the frame into the cell text columns."""
+        if self._df is None:
+            return
+        chunk = self._df.iloc[self._row_count : self._row_count + count]
+        for j, column in enumerate(self._columns):
+            values = chunk.iloc[:, j].to_numpy(dtype=object)
+            column.extend(str(value) for value in values)
+        self._row_count += len(chunk)
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        if parent.isValid() or self._df is None:
+            return False
+        return self._row_count < len(self._df)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        count = min(self.FETCH_ROWS, len(self._df) - self._row_count)
+        last = self._row_count + count - 1
+        self.beginInsertRows(QModelIndex(), self._row_count, last)
+        self._append_rows(count)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return self._columns[index.column()][index.row()]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+
 class DataPreviewWidget(QWidget):
     """Widget for previewing loaded data."""
 
+    # Combined stylesheet shared by every instance (built lazily by _style)
+    _CACHED_STYLE: Optional[str] = None
+    # Rows measured when sizing columns to a newly loaded frame
+    RESIZE_SAMPLE_ROWS = 100
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._setup_ui()
@@ -287,9 +678,15 @@ class DataPreviewWidget(QWidget):
         layout.addWidget(title_label)
 
         # Table
-        self.table = QTableWidget()
+        self.table = QTableView()
+        self.table_model = DataFrameTableModel(self.table)
+        self.table.setModel(self.table_model)
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setDefaultSectionSize(90)
+        header.setResizeContentsPrecision(self.RESIZE_SAMPLE_ROWS)
         layout.addWidget(self.table)
 
         # Statistics
@@ -298,46 +695,38 @@ class DataPreviewWidget(QWidget):
         self.stats_text.setReadOnly(True)
         layout.addWidget(self.stats_text)
 
+    @classmethod
+    def _style(cls) -> str:
+        """Return the combined stylesheet, assembling it on first use only."""
+        if cls._CACHED_STYLE is None:
+            from ..theme import theme
+
+            cls._CACHED_STYLE = (
+                theme.get_widget_base_stylesheet()
+                + theme.get_table_stylesheet().replace("QTableWidget", "QTableView")
+                + theme.get_form_stylesheet()
+            )
+        return cls._CACHED_STYLE
+
     def _apply_styling(self):
         """Apply JetBrains-inspired styling to the widget."""
-        from ..theme import theme
-        self.setStyleSheet(
-            theme.get_widget_base_stylesheet() +
-            theme.get_table_stylesheet() +
-            theme.get_form_stylesheet()
-        )
+        self.setStyleSheet(DataPreviewWidget._style())
 
     def set_data(self, data, source_id: str):
         """Set the data to preview."""
         if data is None:
-            self.table.setRowCount(0)
-            self.table.setColumnCount(0)
+            self.table_model.set_frame(None)
             self.stats_text.clear()
             return
 
         try:
             # Handle wrapped data objects (CandleData/TickData)
-            if hasattr(data, 'df') and data.df is not None:
-                df = data.df
-            elif hasattr(data, 'data') and data.data is not None:
-                df = data.data
-            else:
-                df = data
-
-            # Set table data
-            self.table.setRowCount(min(len(df), 100))  # Limit to 100 rows
-            self.table.setColumnCount(len(df.columns))
-            self.table.setHorizontalHeaderLabels([str(col) for col in df.columns])
-
-            # Fill table
-            for i in range(min(len(df), 100)):
-                for j, col in enumerate(df.columns):
-                    value = df.iloc[i, j]
-                    item = QTableWidgetItem(str(value))
-                    item.setTextAlignment(Qt.AlignCenter)
-                    self.table.setItem(i, j, item)
-
-            # Resize columns
+            df = _as_frame(data)
+
+            # Set table data; further rows are formatted as the view scrolls
+            self.table_model.set_frame(df)
+
+            # Size columns once per frame from a row sample; fetched rows keep them
             self.table.resizeColumnsToContents()
 
             # Set statistics
@@ -349,22 +738,29 @@ class DataPreviewWidget(QWidget):
 
     def _get_data_statistics(self, df, source_id: str) -> str:
         """Get data statistics text."""
+        if hasattr(df.index, 'min'):
+            dmin, dmax = _index_range(df.index)
+            date_range = f"Date Range: {dmin} to {dmax}"
+        else:
+            date_range = "No date range"
+
+        # Counted column by column; the total is their sum
+        missing = _count_missing_per_column(df)
+
         stats = [
             f"Data Source: {source_id}",
             f"Rows: {len(df)}",
             f"Columns: {len(df.columns)}",
-            (
-                f"Date Range: {df.index.min()} to {df.index.max()}"
-                if hasattr(df.index, 'min')
-                else "No date range"
-            ),
-            f"Missing Values: {df.isnull().sum().sum()}",
+            date_range,
+            f"Missing Values: {missing.sum()}",
             "",
             "Column Information:",
         ]
 
-        for col in df.columns:
-            stats.append(f"  {col}: {df[col].dtype} ({df[col].isnull().sum()} missing)")
+        stats.extend(
+            f"  {col}: {dtype} ({count} missing)"
+            for col, dtype, count in zip(df.columns, df.dtypes, missing)
+        )
 
         return "\n".join(stats)
 
@@ -424,11 +820,22 @@ class DataConfigWidget(QWidget):
         ```
     """
 
+    # Combined stylesheet shared by every instance (built lazily by _style)
+    _CACHED_STYLE: Optional[str] = None
+
     def __init__(self, backtest_model: BacktestModel, parent=None):
         super().__init__(parent)
         self.backtest_model = backtest_model
         self.data_source_widgets = {}
 
+        # Statistics render state, used to skip redundant refreshes
+        self._stats_dirty = True
+        self._last_rendered_sources = None
+        self._pending_rendered_sources = None
+        # Incremented per refresh so results of outdated workers are dropped
+        self._stats_generation = 0
+        self._stats_worker: Optional[StatsWorker] = None
+
         self._setup_ui()
         self._setup_connections()
         self._apply_styling()
@@ -536,7 +943,7 @@ class DataConfigWidget(QWidget):
 
         # Refresh button
         refresh_btn = QPushButton("Refresh Statistics")
-        refresh_btn.clicked.connect(self._refresh_statistics)
+        refresh_btn.clicked.connect(lambda: self._refresh_statistics(force=True))
         layout.addWidget(refresh_btn)
 
         return widget
@@ -549,17 +956,28 @@ class DataConfigWidget(QWidget):
         self.backtest_model.data_loading_progress.connect(
             self._on_data_loading_progress
         )
+        self.backtest_model.data_sources_changed.connect(
+            self._mark_statistics_dirty
+        )
+
+    @classmethod
+    def _style(cls) -> str:
+        """Return the combined stylesheet, assembling it on first use only."""
+        if cls._CACHED_STYLE is None:
+            from ..theme import theme
+
+            cls._CACHED_STYLE = (
+                theme.get_widget_base_stylesheet()
+                + theme.get_main_window_stylesheet()
+                + theme.get_scroll_area_stylesheet()
+                + theme.get_button_stylesheet("primary")
+                + theme.get_form_stylesheet()
+            )
+        return cls._CACHED_STYLE
 
     def _apply_styling(self):
         """Apply JetBrains-inspired styling to the widget."""
-        from ..theme import theme
-        self.setStyleSheet(
-            theme.get_widget_base_stylesheet() +
-            theme.get_main_window_stylesheet() +
-            theme.get_scroll_area_stylesheet() +
-            theme.get_button_stylesheet("primary") +
-            theme.get_form_stylesheet()
-        )
+        self.setStyleSheet(DataConfigWidget._style())
 
     def _add_data_source(self):
         """Add a new data source."""
@@ -648,6 +1066,8 @@ class DataConfigWidget(QWidget):
                 has_portuguese = any(
                     col.lower() in portuguese_columns for col in df_peek.columns
                 )
+                # The one-row peek is only needed for detection
+                del df_peek
 
                 if has_portuguese:
                     # Use CandleData.import_from_csv() which handles Portuguese format
@@ -666,7 +1086,7 @@ class DataConfigWidget(QWidget):
                         )
 
                     print(
-                        f"Successfully loaded Portuguese CSV with columns: {list(data_obj.df.columns)}"
+                        f"Successfully loaded Portuguese CSV with columns: {data_obj.df.columns.tolist()}"
                     )
                 else:
                     # Standard CSV loading for English/other formats
@@ -682,20 +1102,10 @@ class DataConfigWidget(QWidget):
                         raise ValueError("Failed to read CSV with common encodings")
 
                     # Create CandleData or TickData based on column detection
-                    ohlc_columns = ['open', 'high', 'low', 'close']
-                    df_columns_lower = [col.lower() for col in df.columns]
-                    has_ohlc = any(col in ohlc_columns for col in df_columns_lower)
-
-                    if has_ohlc:
-                        data_obj = CandleData(
-                            symbol=config.symbol, timeframe=config.timeframe
-                        )
-                        data_obj.df = df
-                        print(f"Created CandleData object for {source_id}")
-                    else:
-                        data_obj = TickData(symbol=config.symbol)
-                        data_obj.df = df
-                        print(f"Created TickData object for {source_id}")
+                    data_obj = _wrap_dataframe(df, config)
+                    print(f"Created {type(data_obj).__name__} object for {source_id}")
+                    # data_obj.df is now the single owner of the frame
+                    del df
 
             elif config.source_type.lower() in ["parquet"]:
                 df = pd.read_parquet(config.file_path)
@@ -705,18 +1115,9 @@ class DataConfigWidget(QWidget):
                     raise ValueError("Loaded data is empty")
 
                 # Create CandleData or TickData based on column detection
-                ohlc_columns = ['open', 'high', 'low', 'close']
-                df_columns_lower = [col.lower() for col in df.columns]
-                has_ohlc = any(col in ohlc_columns for col in df_columns_lower)
-
-                if has_ohlc:
-                    data_obj = CandleData(
-                        symbol=config.symbol, timeframe=config.timeframe
-                    )
-                    data_obj.df = df
-                else:
-                    data_obj = TickData(symbol=config.symbol)
-                    data_obj.df = df
+                data_obj = _wrap_dataframe(df, config)
+                # data_obj.df is now the single owner of the frame
+                del df
 
             elif config.source_type.lower() == "mt5":
                 # MT5 import - delegate to CandleData if available
@@ -734,6 +1135,8 @@ class DataConfigWidget(QWidget):
                 )
                 if df is None or df.empty:
                     raise ValueError("MT5 import returned empty data")
+                # candle_data.df already holds the imported frame
+                del df
                 data_obj = candle_data
             else:
                 raise ValueError(f"Unsupported source type: {config.source_type}")
@@ -762,8 +1165,20 @@ class DataConfigWidget(QWidget):
         self._update_preview()
 
         # Update statistics
+        self._stats_dirty = True
         self._refresh_statistics()
 
+    def sync_loaded_data(self):
+        """Show data the model already holds, e.g. loaded before this widget."""
+        loaded_data = self.backtest_model._loaded_data
+        if not loaded_data:
+            return
+
+        for source_id in loaded_data:
+            if self.preview_source_combo.findData(source_id) == -1:
+                self.preview_source_combo.addItem(source_id, source_id)
+        self._on_data_loaded()
+
     def _on_data_loading_error(self, error_message: str):
         """Handle data loading errors."""
         # Update all source widgets
@@ -783,81 +1198,57 @@ class DataConfigWidget(QWidget):
             data = self.backtest_model._loaded_data.get(current_source)
             self.preview_widget.set_data(data, current_source)
 
-    def _refresh_statistics(self):
-        """Refresh the statistics display."""
-        stats_text = []
+    def _mark_statistics_dirty(self):
+        """Force the next statistics refresh to re-render."""
+        self._stats_dirty = True
+
+    def _refresh_statistics(self, force: bool = False):
+        """Refresh the statistics display.
 
+        The summary is computed by a StatsWorker on the global thread pool so
+        that reductions over large frames do not block the event loop. Unless
+        force is set (as by the Refresh Statistics button), an unchanged
+        display is left as is.
+        """
         # Get the raw loaded data (by source_id) for display purposes
         loaded_data = self.backtest_model._loaded_data
-        if not loaded_data:
-            stats_text.append("No data loaded")
-        else:
-            stats_text.append("Data Sources Summary:")
-            stats_text.append("=" * 50)
-
-            for source_id, data in loaded_data.items():
-                # Determine data type for display
-                data_type = "unknown"
-                if hasattr(data, '__class__'):
-                    class_name = data.__class__.__name__
-                    if 'Candle' in class_name:
-                        data_type = "candle"
-                    elif 'Tick' in class_name:
-                        data_type = "tick"
-                    elif hasattr(data, 'columns'):
-                        # Check if it has OHLC columns (candle data) - support multiple languages
-                        ohlc_columns = [
-                            # English
-                            'open',
-                            'high',
-                            'low',
-                            'close',
-                            # Portuguese
-                            'abertura',
-                            'maxima',
-                            'minima',
-                            'fechamento',
-                            # Spanish
-                            'apertura',
-                            'maximo',
-                            'minimo',
-                            'cierre',
-                            # French
-                            'ouverture',
-                            'haut',
-                            'bas',
-                            'fermeture',
-                        ]
-                        df_columns_lower = [col.lower() for col in data.columns]
-                        has_ohlc = any(col in ohlc_columns for col in df_columns_lower)
-                        data_type = "candle" if has_ohlc else "tick"
-
-                stats_text.append(f"\nSource: {source_id}")
-                stats_text.append("-" * 30)
-                stats_text.append(f"Data Type: {data_type}")
-
-                if hasattr(data, 'symbol'):
-                    stats_text.append(f"Symbol: {data.symbol}")
-                if hasattr(data, 'timeframe'):
-                    stats_text.append(f"Timeframe: {data.timeframe}")
-
-                # Handle wrapped data objects (CandleData/TickData)
-                if hasattr(data, 'df') and data.df is not None:
-                    df = data.df
-                elif hasattr(data, 'data') and data.data is not None:
-                    df = data.data
-                else:
-                    df = data
 
-                if hasattr(df, 'columns'):
-                    stats_text.append(f"Rows: {len(df)}")
-                    stats_text.append(f"Columns: {list(df.columns)}")
+        # Skip the re-render when the same data objects are already displayed
+        rendered_sources = tuple(
+            (source_id, id(data)) for source_id, data in loaded_data.items()
+        )
+        if (
+            not force
+            and rendered_sources == self._last_rendered_sources
+            and not self._stats_dirty
+        ):
+            return
 
-                    if hasattr(df.index, 'min'):
-                        stats_text.append(
-                            f"Date Range: {df.index.min()} to {df.index.max()}"
-                        )
+        # A forced refresh also recomputes frames that were edited in place
+        if force:
+            for data in loaded_data.values():
+                _evict_data_stats(_as_frame(data))
 
-                    stats_text.append(f"Missing Values: {df.isnull().sum().sum()}")
+        # Any worker still running for an older request becomes stale
+        self._stats_generation += 1
+        self._pending_rendered_sources = rendered_sources
+
+        if not loaded_data:
+            self._on_statistics_ready(self._stats_generation, "No data loaded")
+            return
+
+        worker = StatsWorker(self._stats_generation, list(loaded_data.items()))
+        worker.signals.result_ready.connect(self._on_statistics_ready)
+        self._stats_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_statistics_ready(self, generation: int, text: str):
+        """Display statistics computed by a StatsWorker, ignoring stale results."""
+        if generation != self._stats_generation:
+            return
 
-        self.stats_text.setPlainText("\n".join(stats_text))
+        # Release the worker so it no longer keeps the loaded frames alive
+        self._stats_worker = None
+        self.stats_text.setPlainText(text)
+        self._last_rendered_sources = self._pending_rendered_sources
+        self._stats_dirty = False
@@ -5,32 +5,139 @@ This module contains the interface for monitoring backtest execution,
 including real-time progress tracking, live metrics, and results display.
 """
 
-from typing import Optional, Dict, Any, List
+import time
+import traceback
+from collections import deque
+from itertools import cycle
+from typing import Optional, Dict, Any, Deque, List, Mapping, Sequence, Union
+
+import numpy as np
+import pandas as pd
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QGroupBox,
     QLabel,
     QPushButton,
     QProgressBar,
-    QTextEdit,
-    QTableWidget,
-    QTableWidgetItem,
+    QSizePolicy,
+    QPlainTextEdit,
+    QTableView,
     QSplitter,
     QTabWidget,
-    QGridLayout,
     QFrame,
     QScrollArea,
-    QHeaderView,
-    QAbstractItemView,
+    QStackedWidget,
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QThread
-from PySide6.QtGui import QFont, QPalette
+from PySide6.QtCore import (
+    Qt,
+    QEvent,
+    QSize,
+    Slot,
+    QTimer,
+    QPointF,
+    QRectF,
+    QAbstractTableModel,
+    QModelIndex,
+)
+from PySide6.QtGui import QFont, QColor, QPainter, QPen, QBrush, QStaticText
 
 from ..models.backtest_model import BacktestModel
 from ..models.strategy_model import StrategyModel
-from ..controllers.execution_controller import ExecutionController
+from ..controllers.execution_controller import (
+    ExecutionController,
+    LIVE_METRIC_TITLES,
+    LiveMetric,
+)
+
+# Visualizer components for the results tabs; src.visualizer is not importable
+# when the backtester is installed on its own
+try:
+    from src.visualizer.models import BacktestResultModel, IndicatorConfig
+    from src.visualizer.windows.backtest_summary import (
+        KPIGroupWidget,
+        MiniChartWidget,
+        MonthlyResultsWidget,
+    )
+    from src.visualizer.windows.plot_trades import show_candlestick_with_trades
+
+    _VISUALIZER_AVAILABLE = True
+except ImportError:
+    _VISUALIZER_AVAILABLE = False
+
+# Monitor stylesheet rules for the child widgets, matched by object name or
+# widget type so ExecutionMonitorWidget parses a single stylesheet for all of them
+_SECTION_TITLE_QSS = """
+    QLabel#sectionTitle {
+        font-size: 14px;
+        font-weight: bold;
+        color: #fff;
+    }
+"""
+_PROGRESS_QSS = """
+    StatusTextWidget#progressStatus {
+        color: #888;
+    }
+    QLabel#progressEta {
+        color: #888;
+        font-size: 10px;
+    }
+"""
+_LOG_QSS = """
+    LogWidget QPlainTextEdit {
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 10px;
+    }
+"""
+_PLOT_TRADES_QSS = """
+    QPushButton#openTradesChart {
+        background-color: #0066cc;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 5px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton#openTradesChart:hover {
+        background-color: #0088ff;
+    }
+    QLabel#tradesInfo {
+        color: #ccc;
+        font-size: 11px;
+        padding: 10px;
+    }
+    QLabel#noTrades {
+        color: #888;
+        font-size: 14px;
+    }
+"""
+_PLACEHOLDER_QSS = """
+    QLabel#tabPlaceholder {
+        color: #888;
+        font-size: 14px;
+    }
+    QLabel#tabPlaceholder[error="true"] {
+        color: #ff4444;
+    }
+"""
+
+# Trades table P&L colors
+_PROFIT_BRUSH = QBrush(QColor("#00ff00"))
+_LOSS_BRUSH = QBrush(QColor("#ff0000"))
+
+# Live metric values shown before the first update, in LiveMetric order
+_INITIAL_METRIC_VALUES = ("0.00", "0", "0%", "0.00", "0.00", "0.00")
+# Title -> LiveMetric position, for updates keyed by title
+_METRIC_INDEX = {title: LiveMetric(i) for i, title in enumerate(LIVE_METRIC_TITLES)}
+
+# Live metric formatters keyed by exact value type; other types fall back to str
+_FORMATTERS = {
+    float: "{:.2f}".format,
+    np.float64: "{:.2f}".format,
+    int: str,
+    type(None): lambda _: "—",
+}
 
 
 class MetricsCardWidget(QFrame):
@@ -60,6 +167,8 @@ class MetricsCardWidget(QFrame):
         ```
     """
 
+    _CACHED_STYLE: Optional[str] = None
+
     def __init__(self, title: str, value: str = "—", parent=None):
         super().__init__(parent)
         self.title = title
@@ -75,39 +184,193 @@ class MetricsCardWidget(QFrame):
 
         # Title
         self.title_label = QLabel(self.title)
+        self.title_label.setObjectName("metricTitle")
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setStyleSheet(
-            "color: #888; font-size: 11px; font-weight: normal;"
-        )
         layout.addWidget(self.title_label)
 
         # Value
         self.value_label = QLabel(self.value)
+        self.value_label.setObjectName("metricValue")
         self.value_label.setAlignment(Qt.AlignCenter)
-        self.value_label.setStyleSheet(
-            "color: #fff; font-size: 14px; font-weight: bold;"
-        )
         layout.addWidget(self.value_label)
 
+    @classmethod
+    def _style(cls) -> str:
+        """Return the card stylesheet, assembling it on first use only."""
+        if cls._CACHED_STYLE is None:
+            from ..theme import theme
+
+            cls._CACHED_STYLE = f"""
+                MetricsCardWidget {{
+                    background-color: {theme.BACKGROUND_SECONDARY};
+                    border: 1px solid {theme.BORDER_DEFAULT};
+                    border-radius: 6px;
+                }}
+                MetricsCardWidget:hover {{
+                    border-color: {theme.BORDER_HOVER};
+                }}
+                MetricsCardWidget QLabel {{
+                    background-color: transparent;
+                    border: none;
+                }}
+                MetricsCardWidget QLabel#metricTitle {{
+                    color: #888; font-size: 11px; font-weight: normal;
+                }}
+                MetricsCardWidget QLabel#metricValue {{
+                    color: #fff; font-size: 14px; font-weight: bold;
+                }}
+            """
+        return cls._CACHED_STYLE
+
     def _apply_styling(self):
         """Apply JetBrains-inspired styling to the metrics card."""
-        from ..theme import theme
-        self.setStyleSheet(theme.get_card_stylesheet())
+        self.setStyleSheet(MetricsCardWidget._style())
         self.setFixedSize(120, 80)
 
+    @Slot(str)
     def set_value(self, value: str):
         """Update the metric value."""
+        if value == self.value:
+            return
         self.value = value
         self.value_label.setText(value)
 
 
+class MetricsGridCanvas(QWidget):
+    """
+    Widget painting a grid of metric cards directly with QPainter.
+
+    Draws the same cards as MetricsCardWidget without a widget and two labels
+    per card, so a metrics update is a single repaint of one widget. Pens,
+    brushes and fonts are created once and reused by every paint.
+    """
+
+    CARD_WIDTH = 120
+    CARD_HEIGHT = 80
+    SPACING = 6
+    COLUMNS = 3
+
+    def __init__(self, titles: Sequence[str], values: Sequence[str], parent=None):
+        super().__init__(parent)
+        from ..theme import theme
+
+        self._titles = tuple(titles)
+        self._values: List[str] = list(values)
+        self._hovered = -1
+
+        # Paint resources, allocated once
+        self._card_brush = QBrush(QColor(theme.BACKGROUND_SECONDARY))
+        self._border_pen = QPen(QColor(theme.BORDER_DEFAULT), 1)
+        self._hover_pen = QPen(QColor(theme.BORDER_HOVER), 1)
+        self._title_pen = QPen(QColor("#888"))
+        self._value_pen = QPen(QColor("#fff"))
+        self._title_font = QFont(self.font())
+        self._title_font.setPixelSize(11)
+        self._value_font = QFont(self.font())
+        self._value_font.setPixelSize(14)
+        self._value_font.setBold(True)
+
+        # Card geometry never changes, so compute it up front
+        self._card_rects = []
+        for i in range(len(self._titles)):
+            row, col = divmod(i, self.COLUMNS)
+            self._card_rects.append(
+                QRectF(
+                    col * (self.CARD_WIDTH + self.SPACING) + 0.5,
+                    row * (self.CARD_HEIGHT + self.SPACING) + 0.5,
+                    self.CARD_WIDTH - 1,
+                    self.CARD_HEIGHT - 1,
+                )
+            )
+        # Title and value text areas: the top and bottom halves of the padded card
+        self._text_rects = []
+        for rect in self._card_rects:
+            text_rect = rect.adjusted(12, 8, -12, -8)
+            half = text_rect.height() / 2
+            self._text_rects.append(
+                (
+                    text_rect.adjusted(0, 0, 0, -half),
+                    text_rect.adjusted(0, half, 0, 0),
+                )
+            )
+        # Titles never change, so lay them out once and paint the cached glyphs
+        self._static_titles = []
+        for title, (title_rect, _) in zip(self._titles, self._text_rects):
+            static = QStaticText(title)
+            static.setTextFormat(Qt.PlainText)
+            static.prepare(font=self._title_font)
+            size = static.size()
+            offset = QPointF(size.width() / 2, size.height() / 2)
+            self._static_titles.append((title_rect.center() - offset, static))
+        rows = -(-len(self._titles) // self.COLUMNS)
+        columns = min(len(self._titles), self.COLUMNS)
+        self.setFixedSize(
+            columns * self.CARD_WIDTH + max(columns - 1, 0) * self.SPACING,
+            rows * self.CARD_HEIGHT + max(rows - 1, 0) * self.SPACING,
+        )
+        self.setMouseTracking(True)
+
+    def value(self, index: int) -> str:
+        """Get the displayed value of the metric at a position."""
+        return self._values[index]
+
+    def values(self) -> List[str]:
+        """Get a copy of all displayed values, in card order."""
+        return list(self._values)
+
+    def set_values(self, values: Sequence[str]):
+        """Update metric values, repainting once if any displayed text changed."""
+        values = list(values[: len(self._values)])
+        if values != self._values[: len(values)]:
+            self._values[: len(values)] = values
+            self.update()
+
+    def paintEvent(self, event):
+        """Paint all metric cards."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(self._card_brush)
+        for i, rect in enumerate(self._card_rects):
+            painter.setPen(self._hover_pen if i == self._hovered else self._border_pen)
+            painter.drawRoundedRect(rect, 6, 6)
+
+        # Text in two passes so the font and pen change twice, not per card
+        painter.setFont(self._title_font)
+        painter.setPen(self._title_pen)
+        for position, static in self._static_titles:
+            painter.drawStaticText(position, static)
+        painter.setFont(self._value_font)
+        painter.setPen(self._value_pen)
+        for (_, value_rect), value in zip(self._text_rects, self._values):
+            painter.drawText(value_rect, Qt.AlignCenter, value)
+        painter.end()
+
+    def mouseMoveEvent(self, event):
+        """Track the hovered card to highlight its border."""
+        pos = event.position()
+        hovered = next(
+            (i for i, rect in enumerate(self._card_rects) if rect.contains(pos)), -1
+        )
+        if hovered != self._hovered:
+            self._hovered = hovered
+            self.update()
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        """Clear the hover highlight."""
+        if self._hovered != -1:
+            self._hovered = -1
+            self.update()
+        super().leaveEvent(event)
+
+
 class LiveMetricsWidget(QWidget):
     """
     Widget for displaying live backtest metrics.
 
     This widget provides a comprehensive dashboard for monitoring real-time
     performance metrics during backtest execution. It displays key performance
-    indicators in a grid layout using metric cards.
+    indicators as a grid of metric cards painted by a single canvas widget.
 
     The widget tracks and displays:
     - Current P&L (Profit and Loss)
@@ -126,25 +389,22 @@ class LiveMetricsWidget(QWidget):
     - Automatic value formatting
 
     Attributes:
-        metrics_cards (Dict[str, MetricsCardWidget]): Dictionary of metric cards
-        metrics_layout (QGridLayout): Grid layout for metric cards
+        metrics_canvas (MetricsGridCanvas): Canvas painting the metric cards
 
     Example:
         ```python
         metrics_widget = LiveMetricsWidget()
         metrics_widget.update_metrics({
-            "pnl": "$1,234.56",
-            "trades": "45",
-            "win_rate": "65.2%"
+            LiveMetric.PNL: "1,234.56",
+            LiveMetric.TRADES: 45,
+            LiveMetric.WIN_RATE: "65.2%",
         })
         ```
     """
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.metrics_cards = {}
         self._setup_ui()
-        self._apply_styling()
 
     def _setup_ui(self):
         """Setup the live metrics UI."""
@@ -153,60 +413,128 @@ class LiveMetricsWidget(QWidget):
 
         # Title
         title_label = QLabel("Live Metrics")
-        title_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #fff;")
+        title_label.setObjectName("sectionTitle")
         layout.addWidget(title_label)
 
-        # Metrics grid
-        self.metrics_layout = QGridLayout()
-        layout.addLayout(self.metrics_layout)
-
         # Initialize metrics cards
         self._create_metrics_cards()
+        layout.addWidget(self.metrics_canvas)
 
         layout.addStretch()
 
     def _create_metrics_cards(self):
         """Create the metrics cards."""
-        metrics = [
-            ("Current P&L", "0.00"),
-            ("Total Trades", "0"),
-            ("Win Rate", "0%"),
-            ("Max DD", "0.00"),
-            ("Current DD", "0.00"),
-            ("Profit Factor", "0.00"),
-        ]
-
-        for i, (title, value) in enumerate(metrics):
-            card = MetricsCardWidget(title, value)
-            self.metrics_cards[title] = card
-            row = i // 3
-            col = i % 3
-            self.metrics_layout.addWidget(card, row, col)
+        self.metrics_canvas = MetricsGridCanvas(
+            LIVE_METRIC_TITLES, _INITIAL_METRIC_VALUES
+        )
 
-    def _apply_styling(self):
-        """Apply JetBrains-inspired styling to the widget."""
-        from ..theme import theme
-        self.setStyleSheet(theme.get_widget_base_stylesheet())
+    @Slot(object)
+    def update_metrics(self, metrics: Union[Sequence[Any], Mapping[Any, Any]]):
+        """
+        Update the metrics display.
 
-    def update_metrics(self, metrics: Dict[str, Any]):
-        """Update the metrics display."""
-        for title, value in metrics.items():
-            if title in self.metrics_cards:
-                formatted_value = self._format_value(value)
-                self.metrics_cards[title].set_value(formatted_value)
+        Takes either values in LiveMetric order, or a mapping keyed by
+        LiveMetric or metric title for partial updates.
+        """
+        if isinstance(metrics, Mapping):
+            values = self.metrics_canvas.values()
+            for key, value in metrics.items():
+                index = _METRIC_INDEX.get(key, key)
+                if isinstance(index, int) and 0 <= index < len(values):
+                    values[index] = self._format_value(value)
+        else:
+            values = [self._format_value(value) for value in metrics]
+        # The canvas only repaints when a displayed value actually changes
+        self.metrics_canvas.set_values(values)
 
     def _format_value(self, value: Any) -> str:
         """Format a value for display."""
-        if value is None:
-            return "—"
+        # Text pre-formatted by the execution thread, the usual case, is shown as is
+        if type(value) is str:
+            return value
+        return _FORMATTERS.get(type(value), str)(value)
+
 
-        if isinstance(value, (int, float)):
-            if isinstance(value, float):
-                return f"{value:.2f}"
-            else:
-                return str(value)
+class StatusTextWidget(QWidget):
+    """
+    Single line of text painted from cached QStaticText layouts.
 
-        return str(value)
+    The progress status cycles through a handful of strings, so each one is
+    shaped once and later repaints reuse its glyph layout. Text wider than the
+    widget is elided in the middle, with the full text in the tooltip.
+    """
+
+    # Most layouts kept; the cache starts over when it fills up
+    MAX_CACHED_LAYOUTS = 32
+
+    def __init__(self, text: str = "", parent=None):
+        super().__init__(parent)
+        self._text = text
+        # Elided text -> prepared layout
+        self._layouts: Dict[str, QStaticText] = {}
+        self._current: Optional[QStaticText] = None
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self._relayout()
+
+    def text(self) -> str:
+        """Get the full text."""
+        return self._text
+
+    def setText(self, text: str):
+        """Set the text, repainting only when it changes."""
+        if text != self._text:
+            self._text = text
+            self._relayout()
+            self.update()
+
+    def sizeHint(self) -> QSize:
+        """Prefer the width of the full text on a single line."""
+        metrics = self.fontMetrics()
+        return QSize(metrics.horizontalAdvance(self._text), metrics.height())
+
+    def minimumSizeHint(self) -> QSize:
+        """Allow shrinking to any width, since the text is elided."""
+        return QSize(0, self.fontMetrics().height())
+
+    def _relayout(self):
+        """Elide the text to the current width and select its prepared layout."""
+        elided = self.fontMetrics().elidedText(
+            self._text, Qt.ElideMiddle, max(self.width(), 1)
+        )
+        self.setToolTip(self._text if elided != self._text else "")
+        layout = self._layouts.get(elided)
+        if layout is None:
+            if len(self._layouts) >= self.MAX_CACHED_LAYOUTS:
+                self._layouts.clear()
+            layout = QStaticText(elided)
+            layout.setTextFormat(Qt.PlainText)
+            layout.prepare(font=self.font())
+            self._layouts[elided] = layout
+        self._current = layout
+
+    def paintEvent(self, event):
+        """Paint the current text layout, vertically centered."""
+        layout = self._current
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        painter.drawStaticText(
+            QPointF(0, (self.height() - layout.size().height()) / 2), layout
+        )
+        painter.end()
+
+    def resizeEvent(self, event):
+        """Re-elide the text for the new width."""
+        super().resizeEvent(event)
+        self._relayout()
+
+    def changeEvent(self, event):
+        """Drop the layouts shaped with a previous font."""
+        if event.type() == QEvent.FontChange:
+            self._layouts.clear()
+            self._relayout()
+            self.updateGeometry()
+        super().changeEvent(event)
 
 
 class ProgressWidget(QWidget):
@@ -215,7 +543,6 @@ class ProgressWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._setup_ui()
-        self._apply_styling()
 
     def _setup_ui(self):
         """Setup the progress UI."""
@@ -224,7 +551,7 @@ class ProgressWidget(QWidget):
 
         # Title
         title_label = QLabel("Progress")
-        title_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #fff;")
+        title_label.setObjectName("sectionTitle")
         layout.addWidget(title_label)
 
         # Progress bar
@@ -233,44 +560,58 @@ class ProgressWidget(QWidget):
         self.progress_bar.setValue(0)
         layout.addWidget(self.progress_bar)
 
-        # Status label
-        self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("color: #888;")
+        # Status line, painted from cached layouts of the recurring messages
+        self.status_label = StatusTextWidget("Ready")
+        self.status_label.setObjectName("progressStatus")
         layout.addWidget(self.status_label)
 
         # ETA label
         self.eta_label = QLabel("")
-        self.eta_label.setStyleSheet("color: #888; font-size: 10px;")
+        self.eta_label.setObjectName("progressEta")
         layout.addWidget(self.eta_label)
 
-    def _apply_styling(self):
-        """Apply JetBrains-inspired styling to the widget."""
-        from ..theme import theme
-        self.setStyleSheet(
-            theme.get_widget_base_stylesheet() +
-            theme.get_main_window_stylesheet()
-        )
-
+    @Slot(int)
     def set_progress(self, progress: int):
         """Set the progress percentage."""
+        if progress == self.progress_bar.value():
+            return
         self.progress_bar.setValue(progress)
 
+    @Slot(str)
     def set_status(self, status: str):
         """Set the status message."""
         self.status_label.setText(status)
 
+    @Slot(str)
     def set_eta(self, eta: str):
         """Set the ETA message."""
+        if eta == self.eta_label.text():
+            return
         self.eta_label.setText(eta)
 
 
 class LogWidget(QWidget):
     """Widget for displaying backtest logs."""
 
+    # Window in which bursts of log messages are appended as a single block
+    FLUSH_INTERVAL_MS = 50
+    # Oldest lines are discarded by Qt beyond this many blocks
+    MAX_LOG_BLOCKS = 5000
+    # Longer messages are cut, as line layout cost grows with line length
+    MAX_MESSAGE_CHARS = 500
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Messages awaiting the next flush; only the newest MAX_LOG_BLOCKS could
+        # be shown, so older ones are dropped as the buffer overflows
+        self._pending: Deque[str] = deque(maxlen=self.MAX_LOG_BLOCKS)
+        # (epoch second, formatted timestamp) reused for messages in that second
+        self._timestamp_cache = (-1, "")
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_pending)
         self._setup_ui()
-        self._apply_styling()
 
     def _setup_ui(self):
         """Setup the log UI."""
@@ -279,48 +620,119 @@ class LogWidget(QWidget):
 
         # Title
         title_label = QLabel("Execution Log")
-        title_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #fff;")
+        title_label.setObjectName("sectionTitle")
         layout.addWidget(title_label)
 
         # Log text area
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self.MAX_LOG_BLOCKS)
+        self.log_text.setUndoRedoEnabled(False)
+        self.log_text.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.log_text.setMaximumHeight(200)
         layout.addWidget(self.log_text)
 
         # Clear button
         clear_btn = QPushButton("Clear Log")
-        clear_btn.clicked.connect(self.log_text.clear)
+        clear_btn.clicked.connect(self.clear_log)
         layout.addWidget(clear_btn)
 
-    def _apply_styling(self):
-        """Apply JetBrains-inspired styling to the widget."""
-        from ..theme import theme
-        self.setStyleSheet(
-            theme.get_widget_base_stylesheet() +
-            theme.get_form_stylesheet() +
-            theme.get_button_stylesheet("primary") +
-            """
-            QTextEdit {
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 10px;
-            }
-            """
-        )
-
+    @Slot(str)
     def add_log_message(self, message: str):
         """Add a log message."""
-        self.log_text.append(f"[{self._get_timestamp()}] {message}")
-        # Auto-scroll to bottom
-        self.log_text.verticalScrollBar().setValue(
-            self.log_text.verticalScrollBar().maximum()
-        )
+        if len(message) > self.MAX_MESSAGE_CHARS:
+            message = message[: self.MAX_MESSAGE_CHARS] + "…"
+        self._pending.append(f"[{self._get_timestamp()}] {message}")
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @Slot()
+    def clear_log(self):
+        """Clear the log, including messages not yet flushed."""
+        self._pending.clear()
+        self._flush_timer.stop()
+        self.log_text.clear()
+
+    @Slot()
+    def _flush_pending(self):
+        """Append all buffered messages in a single update."""
+        if not self._pending:
+            return
+        # Follow new lines only if the user has not scrolled back in the log
+        scroll_bar = self.log_text.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+        self.log_text.appendPlainText("\n".join(self._pending))
+        self._pending.clear()
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
 
     def _get_timestamp(self) -> str:
         """Get current timestamp string."""
-        from datetime import datetime
+        now = time.time()
+        second = int(now)
+        if self._timestamp_cache[0] != second:
+            self._timestamp_cache = (
+                second,
+                time.strftime("%H:%M:%S", time.localtime(now)),
+            )
+        return self._timestamp_cache[1]
+
+
+class TradesTableModel(QAbstractTableModel):
+    """Read-only model over the first trades of a trades DataFrame."""
+
+    HEADERS = ("Type", "Entry Time", "Exit Time", "Entry Price", "Exit Price", "P&L")
+    PNL_COLUMN = 5
+
+    def __init__(self, trades_df, max_rows: int = 10, parent=None):
+        super().__init__(parent)
+        # Cell text is prepared once, column by column, and only indexed by data()
+        head = trades_df.head(max_rows)
+        type_col, start_col, end_col = (
+            head[col].to_numpy(dtype=object)
+            if col in head.columns
+            else np.full(len(head), 'N/A', dtype=object)
+            for col in ('type', 'start', 'end')
+        )
+        buy_col, sell_col, profit_col = (
+            head[col].to_numpy(dtype=np.float64)
+            if col in head.columns
+            else np.zeros(len(head))
+            for col in ('buyprice', 'sellprice', 'profit')
+        )
+        # P&L falls back to the price difference when no profit was recorded
+        self._pnl = np.where(profit_col != 0, profit_col, sell_col - buy_col)
+        self._columns = (
+            [str(value) for value in type_col],
+            [str(value) for value in start_col],
+            [str(value) for value in end_col],
+            np.char.mod("%.4f", buy_col).tolist(),
+            np.char.mod("%.4f", sell_col).tolist(),
+            np.char.mod("%.2f", self._pnl).tolist(),
+        )
+        self._row_count = len(head)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return self._columns[index.column()][index.row()]
+        if role == Qt.ForegroundRole and index.column() == self.PNL_COLUMN:
+            pnl = self._pnl[index.row()]
+            if pnl > 0:
+                return _PROFIT_BRUSH
+            if pnl < 0:
+                return _LOSS_BRUSH
+        return None
 
-        return datetime.now().strftime("%H:%M:%S")
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
 
 
 class ExecutionMonitorWidget(QWidget):
@@ -378,6 +790,22 @@ class ExecutionMonitorWidget(QWidget):
         ```
     """
 
+    # Shortest time between two live metrics repaints
+    METRICS_FAST_INTERVAL_MS = 250
+    # Progress bar updates are coalesced to at most one per interval (~30 Hz)
+    PROGRESS_MIN_INTERVAL_MS = 33
+
+    # Longest placeholder text shown; error messages beyond this are cut with "…"
+    PLACEHOLDER_MAX_CHARS = 500
+
+    # Pages of the plot trades tab stack
+    PLOT_TRADES_EMPTY_PAGE = 0
+    PLOT_TRADES_CONTENT_PAGE = 1
+    PLOT_TRADES_ERROR_PAGE = 2
+
+    _CACHED_STYLE: Optional[str] = None
+    _CACHED_TRADES_TABLE_STYLE: Optional[str] = None
+
     def __init__(
         self,
         backtest_model: BacktestModel,
@@ -389,15 +817,29 @@ class ExecutionMonitorWidget(QWidget):
         self.backtest_model = backtest_model
         self.strategy_model = strategy_model
         self.execution_controller = execution_controller
+        # Latest metrics pushed by the controller and not yet displayed
+        self._pending_metrics: Optional[tuple] = None
+        self._next_metrics_time = 0.0
+        self._last_status: Optional[str] = None
+        self._pending_progress: Optional[int] = None
+        self._last_progress_time = 0.0
+        # Results awaiting display until a results tab is first opened
+        self._pending_results = None
 
         self._setup_ui()
         self._setup_connections()
         self._apply_styling()
 
-        # Update timer for live metrics
+        # Paces pushed live metrics to the redraw rate ceiling
         self.update_timer = QTimer()
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setTimerType(Qt.CoarseTimer)
         self.update_timer.timeout.connect(self._update_live_metrics)
-        self.update_timer.setInterval(1000)  # Update every second
+
+        # Shows the last progress value of a burst once the interval elapses
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.timeout.connect(self._flush_progress)
 
     def _setup_ui(self):
         """Setup the execution monitor UI."""
@@ -429,9 +871,9 @@ class ExecutionMonitorWidget(QWidget):
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(10, 10, 10, 10)
 
-        # Create splitter for left and right panels
-        splitter = QSplitter(Qt.Horizontal)
-        layout.addWidget(splitter)
+        # Left and right panels share the width equally
+        row = QHBoxLayout()
+        layout.addLayout(row)
 
         # Left panel: Progress and metrics
         left_panel = QWidget()
@@ -446,7 +888,7 @@ class ExecutionMonitorWidget(QWidget):
         left_layout.addWidget(self.live_metrics_widget)
 
         left_layout.addStretch()
-        splitter.addWidget(left_panel)
+        row.addWidget(left_panel, 1)
 
         # Right panel: Logs
         right_panel = QWidget()
@@ -456,11 +898,7 @@ class ExecutionMonitorWidget(QWidget):
         self.log_widget = LogWidget()
         right_layout.addWidget(self.log_widget)
 
-        splitter.addWidget(right_panel)
-
-        # Set splitter proportions
-        splitter.setStretchFactor(0, 1)  # Left panel
-        splitter.setStretchFactor(1, 1)  # Right panel
+        row.addWidget(right_panel, 1)
 
         return widget
 
@@ -470,10 +908,11 @@ class ExecutionMonitorWidget(QWidget):
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(5, 5, 5, 5)
 
-        # Create a placeholder widget that will be replaced with visualizer content
+        # Placeholder shown while no visualizer content is available
         self.results_placeholder = QLabel("No results available")
         self.results_placeholder.setAlignment(Qt.AlignCenter)
-        self.results_placeholder.setStyleSheet("color: #888; font-size: 14px;")
+        self.results_placeholder.setTextFormat(Qt.PlainText)
+        self.results_placeholder.setObjectName("tabPlaceholder")
         layout.addWidget(self.results_placeholder)
 
         # Store reference for the visualizer widget
@@ -487,14 +926,33 @@ class ExecutionMonitorWidget(QWidget):
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(5, 5, 5, 5)
 
-        # Create a placeholder widget that will be replaced with plot trades content
+        # Empty, content and error pages, switched with setCurrentIndex
+        self.plot_trades_stack = QStackedWidget()
+
         self.plot_trades_placeholder = QLabel("No trades data available")
         self.plot_trades_placeholder.setAlignment(Qt.AlignCenter)
-        self.plot_trades_placeholder.setStyleSheet("color: #888; font-size: 14px;")
-        layout.addWidget(self.plot_trades_placeholder)
+        self.plot_trades_placeholder.setTextFormat(Qt.PlainText)
+        self.plot_trades_placeholder.setObjectName("tabPlaceholder")
+        self.plot_trades_stack.addWidget(self.plot_trades_placeholder)
+
+        self.plot_trades_host = QWidget()
+        QVBoxLayout(self.plot_trades_host).setContentsMargins(0, 0, 0, 0)
+        self.plot_trades_stack.addWidget(self.plot_trades_host)
+
+        self.plot_trades_error = QLabel()
+        self.plot_trades_error.setAlignment(Qt.AlignCenter)
+        self.plot_trades_error.setTextFormat(Qt.PlainText)
+        self.plot_trades_error.setObjectName("tabPlaceholder")
+        self.plot_trades_error.setProperty("error", True)
+        self.plot_trades_stack.addWidget(self.plot_trades_error)
+
+        layout.addWidget(self.plot_trades_stack)
 
-        # Store reference for the plot trades widget
+        # Store reference for the plot trades widget, hosted by the content page
         self.plot_trades_widget = None
+        # Data behind its Open Trades Chart button, and the last chart opened
+        self._trades_context: Optional[Dict[str, Any]] = None
+        self._trades_chart_window = None
 
         return widget
 
@@ -506,15 +964,14 @@ class ExecutionMonitorWidget(QWidget):
         # Run backtest button
         self.run_btn = QPushButton("Run Backtest")
         self.run_btn.clicked.connect(self._run_backtest)
-        from ..theme import theme
-        self.run_btn.setStyleSheet(theme.get_button_stylesheet("success"))
+        self.run_btn.setProperty("role", "run")
         button_layout.addWidget(self.run_btn)
 
         # Stop backtest button
         self.stop_btn = QPushButton("Stop Backtest")
         self.stop_btn.clicked.connect(self._stop_backtest)
         self.stop_btn.setEnabled(False)
-        self.stop_btn.setStyleSheet(theme.get_button_stylesheet("danger"))
+        self.stop_btn.setProperty("role", "stop")
         button_layout.addWidget(self.stop_btn)
 
         # Clear results button
@@ -532,15 +989,59 @@ class ExecutionMonitorWidget(QWidget):
         self.execution_controller.backtest_error.connect(self._on_backtest_error)
         self.execution_controller.progress_updated.connect(self._on_progress_updated)
         self.execution_controller.status_updated.connect(self._on_status_updated)
+        self.execution_controller.metrics_ready.connect(self._on_metrics_ready)
+
+        # Live metrics are only shown while the execution tab is visible
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+
+    @classmethod
+    def _style(cls) -> str:
+        """Return the stylesheet for the monitor and its children, built once."""
+        if cls._CACHED_STYLE is None:
+            from ..theme import theme
+
+            # The primary button style is scoped to the log's Clear Log button
+            log_button_qss = theme.get_button_stylesheet("primary").replace(
+                "QPushButton", "LogWidget QPushButton"
+            )
+            # Run and stop button styles, selected by the buttons' role property
+            run_button_qss = theme.get_button_stylesheet("success").replace(
+                "QPushButton", 'QPushButton[role="run"]'
+            )
+            stop_button_qss = theme.get_button_stylesheet("danger").replace(
+                "QPushButton", 'QPushButton[role="stop"]'
+            )
+            cls._CACHED_STYLE = (
+                theme.get_widget_base_stylesheet()
+                + theme.get_main_window_stylesheet()
+                + theme.get_form_stylesheet()
+                + log_button_qss
+                + run_button_qss
+                + stop_button_qss
+                + _SECTION_TITLE_QSS
+                + _PROGRESS_QSS
+                + _LOG_QSS
+                + _PLOT_TRADES_QSS
+                + _PLACEHOLDER_QSS
+            )
+        return cls._CACHED_STYLE
+
+    @classmethod
+    def _trades_table_style(cls) -> str:
+        """Return the trades table stylesheet, built once."""
+        if cls._CACHED_TRADES_TABLE_STYLE is None:
+            from ..theme import theme
+
+            cls._CACHED_TRADES_TABLE_STYLE = theme.get_table_stylesheet().replace(
+                "QTableWidget", "QTableView"
+            )
+        return cls._CACHED_TRADES_TABLE_STYLE
 
     def _apply_styling(self):
         """Apply JetBrains-inspired styling to the widget."""
-        from ..theme import theme
-        self.setStyleSheet(
-            theme.get_widget_base_stylesheet() +
-            theme.get_main_window_stylesheet()
-        )
+        self.setStyleSheet(ExecutionMonitorWidget._style())
 
+    @Slot()
     def _run_backtest(self):
         """Run the backtest."""
         try:
@@ -571,116 +1072,208 @@ class ExecutionMonitorWidget(QWidget):
                 f"ERROR: Failed to start backtest: {str(e)}"
             )
 
+    @Slot()
     def _stop_backtest(self):
         """Stop the running backtest."""
         self.log_widget.add_log_message("Stopping backtest...")
         self.execution_controller.stop_backtest()
 
+    @Slot()
     def _clear_results(self):
         """Clear the results display."""
         # Clear results display
+        self._pending_results = None
+        self._discard_results_widget()
+        self._show_placeholder(self.results_placeholder, "No results available")
+
+        # Clear plot trades display
+        self._discard_plot_trades_widget()
+        self.plot_trades_stack.setCurrentIndex(self.PLOT_TRADES_EMPTY_PAGE)
+        self.execution_controller.clear_results()
+        self.log_widget.add_log_message("Results cleared")
+
+    def _show_placeholder(self, placeholder: QLabel, text: str, error: bool = False):
+        """Show a tab placeholder, restyling it only when its state changes."""
+        if bool(placeholder.property("error")) != error:
+            # Re-polish so the monitor stylesheet matches the new error state
+            placeholder.setProperty("error", error)
+            placeholder.style().unpolish(placeholder)
+            placeholder.style().polish(placeholder)
+        placeholder.setText(self._clip_placeholder_text(text))
+        placeholder.show()
+
+    def _clip_placeholder_text(self, text: str) -> str:
+        """Cut a placeholder message so its label layout stays cheap."""
+        if len(text) > self.PLACEHOLDER_MAX_CHARS:
+            return text[: self.PLACEHOLDER_MAX_CHARS] + "…"
+        return text
+
+    def _discard_results_widget(self):
+        """Remove the current visualizer widget from the results tab."""
         if self.results_visualizer_widget is not None:
-            self.results_visualizer_widget.setParent(None)
+            self.results_visualizer_widget.hide()
+            self.results_visualizer_widget.deleteLater()
             self.results_visualizer_widget = None
 
-        if self.results_placeholder is None:
-            self.results_placeholder = QLabel("No results available")
-            self.results_placeholder.setAlignment(Qt.AlignCenter)
-            self.results_placeholder.setStyleSheet("color: #888; font-size: 14px;")
-            self.results_tab.layout().addWidget(self.results_placeholder)
-        else:
-            self.results_placeholder.setText("No results available")
-
-        # Clear plot trades display
+    def _discard_plot_trades_widget(self):
+        """Remove the current plot trades widget from its tab."""
         if self.plot_trades_widget is not None:
-            self.plot_trades_widget.setParent(None)
+            self.plot_trades_widget.hide()
+            self.plot_trades_widget.deleteLater()
             self.plot_trades_widget = None
+        # Release the frames the widget's button would have charted
+        self._trades_context = None
 
-        if self.plot_trades_placeholder is None:
-            self.plot_trades_placeholder = QLabel("No trades data available")
-            self.plot_trades_placeholder.setAlignment(Qt.AlignCenter)
-            self.plot_trades_placeholder.setStyleSheet("color: #888; font-size: 14px;")
-            self.plot_trades_tab.layout().addWidget(self.plot_trades_placeholder)
-        else:
-            self.plot_trades_placeholder.setText("No trades data available")
-        self.execution_controller.clear_results()
-        self.log_widget.add_log_message("Results cleared")
-
+    @Slot()
     def _on_backtest_started(self):
         """Handle backtest start."""
-        self.run_btn.setEnabled(False)
-        self.stop_btn.setEnabled(True)
-        self.progress_widget.set_progress(0)
-        self.progress_widget.set_status("Running backtest...")
-        self.update_timer.start()
-        self.log_widget.add_log_message("Backtest started")
-
+        # Apply the state change with painting suspended, then repaint once
+        self.setUpdatesEnabled(False)
+        try:
+            self.run_btn.setEnabled(False)
+            self.stop_btn.setEnabled(True)
+            self.progress_widget.set_progress(0)
+            self.progress_widget.set_status("Running backtest...")
+            self._last_status = None
+            self.log_widget.add_log_message("Backtest started")
+        finally:
+            self.setUpdatesEnabled(True)
+
+    @Slot(object)
     def _on_backtest_finished(self, results):
         """Handle backtest completion."""
-        self.run_btn.setEnabled(True)
-        self.stop_btn.setEnabled(False)
-        self.progress_widget.set_progress(100)
-        self.progress_widget.set_status("Backtest completed")
-        self.update_timer.stop()
-        self.log_widget.add_log_message("Backtest completed successfully")
-
-        # Update results display
-        self._update_results_display(results)
-
+        self.setUpdatesEnabled(False)
+        try:
+            self.run_btn.setEnabled(True)
+            self.stop_btn.setEnabled(False)
+            self._progress_timer.stop()
+            self._pending_progress = None
+            self.progress_widget.set_progress(100)
+            self.progress_widget.set_status("Backtest completed")
+            # Show the final metrics even if the ceiling would delay them
+            self.update_timer.stop()
+            self._update_live_metrics()
+            self.log_widget.add_log_message("Backtest completed successfully")
+
+            # Update results display
+            self._update_results_display(results)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    @Slot(str)
     def _on_backtest_error(self, error_message: str):
         """Handle backtest errors."""
-        self.run_btn.setEnabled(True)
-        self.stop_btn.setEnabled(False)
-        self.progress_widget.set_status("Backtest failed")
-        self.update_timer.stop()
-        self.log_widget.add_log_message(f"ERROR: {error_message}")
-
+        self.setUpdatesEnabled(False)
+        try:
+            self.run_btn.setEnabled(True)
+            self.stop_btn.setEnabled(False)
+            self.progress_widget.set_status("Backtest failed")
+            self.update_timer.stop()
+            self._progress_timer.stop()
+            self._flush_progress()
+            self.log_widget.add_log_message(f"ERROR: {error_message}")
+        finally:
+            self.setUpdatesEnabled(True)
+
+    @Slot(int)
     def _on_progress_updated(self, progress: int):
-        """Handle progress updates."""
-        self.progress_widget.set_progress(progress)
+        """Handle progress updates, coalescing bursts into paced bar updates."""
+        self._pending_progress = progress
+        if self._progress_timer.isActive():
+            return
+        wait_ms = self.PROGRESS_MIN_INTERVAL_MS - int(
+            (time.perf_counter() - self._last_progress_time) * 1000
+        )
+        if wait_ms > 0:
+            self._progress_timer.start(wait_ms)
+        else:
+            self._flush_progress()
 
+    @Slot()
+    def _flush_progress(self):
+        """Show the most recent progress value."""
+        if self._pending_progress is not None:
+            self.progress_widget.set_progress(self._pending_progress)
+            self._pending_progress = None
+            self._last_progress_time = time.perf_counter()
+
+    @Slot(str)
     def _on_status_updated(self, status: str):
         """Handle status updates."""
         self.progress_widget.set_status(status)
-        self.log_widget.add_log_message(status)
-
+        # Don't repeat an unchanged status in the log
+        if status != self._last_status:
+            self._last_status = status
+            self.log_widget.add_log_message(status)
+
+    @Slot(tuple)
+    def _on_metrics_ready(self, metrics: tuple):
+        """Queue pushed live metrics for the next paced update."""
+        self._pending_metrics = metrics
+        self._schedule_live_metrics()
+
+    @Slot(int)
+    def _on_tab_changed(self, index: int):
+        """Hold live metrics while the execution tab is hidden."""
+        if self.tab_widget.widget(index) is self.execution_tab:
+            self._schedule_live_metrics()
+        else:
+            self.update_timer.stop()
+            # Build deferred results now that a results tab is shown
+            if self._pending_results is not None:
+                results, self._pending_results = self._pending_results, None
+                self._update_results_display(results)
+
+    def showEvent(self, event):
+        """Show metrics pushed while the monitor was hidden."""
+        super().showEvent(event)
+        self._schedule_live_metrics()
+
+    def _schedule_live_metrics(self):
+        """Arm the next live metrics update if metrics wait on a visible tab."""
+        if (
+            self._pending_metrics is not None
+            and not self.update_timer.isActive()
+            and self.tab_widget.currentWidget() is self.execution_tab
+            and self.live_metrics_widget.isVisible()
+        ):
+            wait_ms = (self._next_metrics_time - time.perf_counter()) * 1000
+            self.update_timer.start(max(int(wait_ms), 0))
+
+    @Slot()
     def _update_live_metrics(self):
-        """Update live metrics during backtest execution."""
-        if self.execution_controller.is_running():
-            # Get current results for live metrics
-            results = self.execution_controller.get_current_results()
-            if results:
-                metrics = self._extract_live_metrics(results)
-                self.live_metrics_widget.update_metrics(metrics)
-
-    def _extract_live_metrics(self, results) -> Dict[str, Any]:
-        """Extract live metrics from results."""
-        try:
-            return {
-                "Current P&L": f"{results.net_balance:.2f}",
-                "Total Trades": str(len(results.trades)),
-                "Win Rate": f"{results.accuracy:.1f}%",
-                "Max DD": f"{results._compute_maximum_drawdown().get('maximum_drawdown', 0):.2f}",
-                "Current DD": "0.00",  # TODO: Calculate current drawdown
-                "Profit Factor": f"{results.profit_factor:.2f}",
-            }
-        except Exception as e:
-            return {
-                "Current P&L": "—",
-                "Total Trades": "—",
-                "Win Rate": "—",
-                "Max DD": "—",
-                "Current DD": "—",
-                "Profit Factor": "—",
-            }
+        """Show the latest pushed live metrics."""
+        metrics, self._pending_metrics = self._pending_metrics, None
+        if metrics:
+            started = time.perf_counter()
+            # Metrics arrive already formatted from the execution thread
+            self.live_metrics_widget.update_metrics(metrics)
+            # Back off when an update costs more than the interval it runs in
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._next_metrics_time = (
+                started + max(self.METRICS_FAST_INTERVAL_MS, 2 * elapsed_ms) / 1000
+            )
 
     def _update_results_display(self, results):
         """Update the results display with integrated visualizer."""
+        # Nothing shows the result tabs from the execution tab, so defer the
+        # visualizer build until one of them is opened
+        if self.tab_widget.currentWidget() is self.execution_tab:
+            self._pending_results = results
+            return
+
+        # Build both result tabs with painting suspended, then repaint once
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            self._populate_results_display(results)
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+
+    def _populate_results_display(self, results):
+        """Fill the results and plot trades tabs from the backtest results."""
         try:
-            # Import the visualizer components
-            import pandas as pd
-            from src.visualizer.windows.backtest_summary import BacktestSummaryWindow
-            from src.visualizer.models import BacktestResultModel
+            if not _VISUALIZER_AVAILABLE:
+                raise ImportError("src.visualizer is not available")
 
             # Get OHLC data if available
             ohlc_data = None
@@ -722,10 +1315,9 @@ class ExecutionMonitorWidget(QWidget):
                 ohlc_df=ohlc_data,
             )
 
-            # Remove the placeholder
-            if self.results_placeholder is not None:
-                self.results_placeholder.setParent(None)
-                self.results_placeholder = None
+            # Replace any previous content and hide the placeholder
+            self._discard_results_widget()
+            self.results_placeholder.hide()
 
             # Create the visualizer widget (without the main window wrapper)
             visualizer_widget = self._create_visualizer_widget(model)
@@ -738,31 +1330,18 @@ class ExecutionMonitorWidget(QWidget):
             self.results_visualizer_widget = visualizer_widget
 
             # Also update the Plot Trades tab
-            self._update_plot_trades_display(results, ohlc_data)
+            self._update_plot_trades_display(model, ohlc_data)
 
         except Exception as e:
             # Fallback to simple text display
-            if self.results_placeholder is not None:
-                self.results_placeholder.setText(f"Error displaying results: {str(e)}")
-                self.results_placeholder.setStyleSheet("color: #ff4444;")
-            else:
-                # Create a new placeholder if needed
-                self.results_placeholder = QLabel(f"Error displaying results: {str(e)}")
-                self.results_placeholder.setAlignment(Qt.AlignCenter)
-                self.results_placeholder.setStyleSheet(
-                    "color: #ff4444; font-size: 14px;"
-                )
-                self.results_tab.layout().addWidget(self.results_placeholder)
+            self._show_placeholder(
+                self.results_placeholder,
+                f"Error displaying results: {str(e)}",
+                error=True,
+            )
 
     def _create_visualizer_widget(self, model):
         """Create a visualizer widget from the BacktestResultModel."""
-        from src.visualizer.windows.backtest_summary import (
-            KPIGroupWidget,
-            MiniChartWidget,
-            MonthlyResultsWidget,
-        )
-        from PySide6.QtWidgets import QScrollArea, QSplitter
-
         # Create a container widget
         container = QWidget()
         layout = QHBoxLayout(container)
@@ -772,8 +1351,11 @@ class ExecutionMonitorWidget(QWidget):
         splitter = QSplitter(Qt.Horizontal)
         layout.addWidget(splitter)
 
-        # Left panel: KPIs
-        kpi_widget = self._create_kpi_panel(model)
+        # Left panel: KPIs, normally pre-formatted by the execution thread
+        kpi_groups = self.execution_controller.get_current_kpis()
+        if kpi_groups is None:
+            kpi_groups = model.kpi_groups
+        kpi_widget = self._create_kpi_panel(kpi_groups)
         splitter.addWidget(kpi_widget)
 
         # Right panel: Charts and monthly results
@@ -786,11 +1368,8 @@ class ExecutionMonitorWidget(QWidget):
 
         return container
 
-    def _create_kpi_panel(self, model):
+    def _create_kpi_panel(self, kpi_groups):
         """Create the KPI panel with grouped metrics."""
-        from PySide6.QtWidgets import QScrollArea
-        from src.visualizer.windows.backtest_summary import KPIGroupWidget
-
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
@@ -799,9 +1378,6 @@ class ExecutionMonitorWidget(QWidget):
         kpi_layout = QVBoxLayout(kpi_container)
         kpi_layout.setSpacing(15)
 
-        # Define KPI groups
-        kpi_groups = self._get_kpi_groups(model)
-
         # Create group widgets
         for group_title, kpis in kpi_groups:
             if kpis:  # Only create group if it has KPIs
@@ -815,11 +1391,6 @@ class ExecutionMonitorWidget(QWidget):
 
     def _create_charts_panel(self, model):
         """Create the charts panel with equity curve, drawdown, and monthly results."""
-        from src.visualizer.windows.backtest_summary import (
-            MiniChartWidget,
-            MonthlyResultsWidget,
-        )
-
         charts_container = QWidget()
         charts_layout = QVBoxLayout(charts_container)
         charts_layout.setSpacing(10)
@@ -846,351 +1417,87 @@ class ExecutionMonitorWidget(QWidget):
 
         return charts_container
 
-    def _get_kpi_groups(self, model):
-        """Get organized KPI groups with formatted values."""
-        result = model.result
-
-        groups = [
-            (
-                "P&L",
-                [
-                    (
-                        "Net Balance",
-                        model.format_value(
-                            "net_balance (BRL)", result.get("net_balance (BRL)")
-                        ),
-                    ),
-                    (
-                        "Gross Balance",
-                        model.format_value(
-                            "gross_balance (BRL)", result.get("gross_balance (BRL)")
-                        ),
-                    ),
-                    (
-                        "Total Profit",
-                        model.format_value(
-                            "total_profit (BRL)", result.get("total_profit (BRL)")
-                        ),
-                    ),
-                    (
-                        "Total Loss",
-                        model.format_value(
-                            "total_loss (BRL)", result.get("total_loss (BRL)")
-                        ),
-                    ),
-                    (
-                        "Total Tax",
-                        model.format_value(
-                            "total_tax (BRL)", result.get("total_tax (BRL)")
-                        ),
-                    ),
-                    (
-                        "Total Cost",
-                        model.format_value(
-                            "total_cost (BRL)", result.get("total_cost (BRL)")
-                        ),
-                    ),
-                ],
-            ),
-            (
-                "Performance",
-                [
-                    (
-                        "Profit Factor",
-                        model.format_value(
-                            "profit_factor", result.get("profit_factor")
-                        ),
-                    ),
-                    (
-                        "Accuracy",
-                        model.format_value("accuracy (%)", result.get("accuracy (%)")),
-                    ),
-                    (
-                        "Mean Profit",
-                        model.format_value(
-                            "mean_profit (BRL)", result.get("mean_profit (BRL)")
-                        ),
-                    ),
-                    (
-                        "Mean Loss",
-                        model.format_value(
-                            "mean_loss (BRL)", result.get("mean_loss (BRL)")
-                        ),
-                    ),
-                    (
-                        "Mean Ratio",
-                        model.format_value("mean_ratio", result.get("mean_ratio")),
-                    ),
-                    (
-                        "Std Deviation",
-                        model.format_value(
-                            "standard_deviation", result.get("standard_deviation")
-                        ),
-                    ),
-                ],
-            ),
-            (
-                "Trades",
-                [
-                    (
-                        "Total Trades",
-                        model.format_value("total_trades", result.get("total_trades")),
-                    ),
-                    (
-                        "Positive Trades",
-                        model.format_value(
-                            "positive_trades", result.get("positive_trades")
-                        ),
-                    ),
-                    (
-                        "Negative Trades",
-                        model.format_value(
-                            "negative_trades", result.get("negative_trades")
-                        ),
-                    ),
-                ],
-            ),
-            (
-                "Risk",
-                [
-                    (
-                        "Max Drawdown",
-                        model.format_value(
-                            "maximum_drawdown (BRL)",
-                            result.get("maximum_drawdown (BRL)"),
-                        ),
-                    ),
-                    (
-                        "Drawdown %",
-                        model.format_value(
-                            "drawdown_relative (%)", result.get("drawdown_relative (%)")
-                        ),
-                    ),
-                    (
-                        "Final Drawdown %",
-                        model.format_value(
-                            "drawdown_final (%)", result.get("drawdown_final (%)")
-                        ),
-                    ),
-                ],
-            ),
-            (
-                "Period",
-                [
-                    (
-                        "Start Date",
-                        model.format_value("start_date", result.get("start_date")),
-                    ),
-                    (
-                        "End Date",
-                        model.format_value("end_date", result.get("end_date")),
-                    ),
-                    (
-                        "Duration",
-                        model.format_value("duration", result.get("duration")),
-                    ),
-                    (
-                        "Avg Monthly",
-                        model.format_value(
-                            "average_monthly_result (BRL)",
-                            result.get("average_monthly_result (BRL)"),
-                        ),
-                    ),
-                ],
-            ),
-        ]
-
-        # Filter out groups with all None/empty values
-        filtered_groups = []
-        for group_title, kpis in groups:
-            valid_kpis = [
-                (label, value)
-                for label, value in kpis
-                if value != "—" and value is not None
-            ]
-            if valid_kpis:
-                filtered_groups.append((group_title, valid_kpis))
-
-        return filtered_groups
-
-    def _update_plot_trades_display(self, results, ohlc_data):
-        """Update the plot trades display with PlotTradesWindow."""
+    def _update_plot_trades_display(self, model, ohlc_data):
+        """Update the plot trades display from the results tab's BacktestResultModel."""
         try:
-            # Import the visualizer components
-            from src.visualizer.windows.plot_trades import PlotTradesWindow
-            from src.visualizer.models import BacktestResultModel
-
-            # Create the visualizer model to get trades data
-            model = BacktestResultModel(
-                registry=results,
-                result=results.result if hasattr(results, 'result') else results,
-                ohlc_df=ohlc_data,
-            )
-
             # Get trades data
             trades_df = model.trades_df
-            if trades_df is None or trades_df.empty:
-                if self.plot_trades_placeholder is not None:
-                    self.plot_trades_placeholder.setText("No trades data available")
+            has_trades = trades_df is not None and len(trades_df) > 0
+            # Replace any previous content
+            self._discard_plot_trades_widget()
+            if not has_trades:
+                self.plot_trades_stack.setCurrentIndex(self.PLOT_TRADES_EMPTY_PAGE)
                 return
 
-            # Remove the placeholder
-            if self.plot_trades_placeholder is not None:
-                self.plot_trades_placeholder.setParent(None)
-                self.plot_trades_placeholder = None
-
             # Create the plot trades widget
-            plot_trades_widget = self._create_plot_trades_widget(model, ohlc_data)
+            plot_trades_widget = self._create_plot_trades_widget(
+                model, ohlc_data, trades_df
+            )
 
-            # Add it to the plot trades tab layout
-            plot_trades_layout = self.plot_trades_tab.layout()
-            plot_trades_layout.addWidget(plot_trades_widget)
+            # Add it to the content page and show that page
+            self.plot_trades_host.layout().addWidget(plot_trades_widget)
+            self.plot_trades_stack.setCurrentIndex(self.PLOT_TRADES_CONTENT_PAGE)
 
             # Store reference
             self.plot_trades_widget = plot_trades_widget
 
         except Exception as e:
             # Fallback to simple text display
-            if self.plot_trades_placeholder is not None:
-                self.plot_trades_placeholder.setText(
-                    f"Error displaying trades: {str(e)}"
-                )
-                self.plot_trades_placeholder.setStyleSheet("color: #ff4444;")
-            else:
-                # Create a new placeholder if needed
-                from PySide6.QtWidgets import QLabel
-                self.plot_trades_placeholder = QLabel(
-                    f"Error displaying trades: {str(e)}"
-                )
-                self.plot_trades_placeholder.setAlignment(Qt.AlignCenter)
-                self.plot_trades_placeholder.setStyleSheet(
-                    "color: #ff4444; font-size: 14px;"
-                )
-                self.plot_trades_tab.layout().addWidget(self.plot_trades_placeholder)
-
-    def _create_plot_trades_widget(self, model, ohlc_data):
-        """Create a plot trades widget from the BacktestResultModel."""
-        from src.visualizer.windows.plot_trades import PlotTradesWindow
-        from src.visualizer.models import IndicatorConfig
-        from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton
-        from PySide6.QtCore import Qt
+            self.plot_trades_error.setText(
+                self._clip_placeholder_text(f"Error displaying trades: {str(e)}")
+            )
+            self.plot_trades_stack.setCurrentIndex(self.PLOT_TRADES_ERROR_PAGE)
 
+    def _create_plot_trades_widget(self, model, ohlc_data, trades_df=None):
+        """Create a plot trades widget; a given trades_df must hold trades."""
         # Create a container widget
         container = QWidget()
         layout = QVBoxLayout(container)
         layout.setContentsMargins(5, 5, 5, 5)
 
-        # Get trades data
-        trades_df = model.trades_df
-        if trades_df is None or trades_df.empty:
-            no_trades_label = QLabel("No trades data available")
-            no_trades_label.setAlignment(Qt.AlignCenter)
-            no_trades_label.setStyleSheet("color: #888; font-size: 14px;")
-            layout.addWidget(no_trades_label)
-            return container
+        # Get trades data, unless the caller already did and found trades
+        if trades_df is None:
+            trades_df = model.trades_df
+            if trades_df is None or len(trades_df) == 0:
+                no_trades_label = QLabel("No trades data available")
+                no_trades_label.setObjectName("noTrades")
+                no_trades_label.setAlignment(Qt.AlignCenter)
+                layout.addWidget(no_trades_label)
+                return container
 
         # Create a button to open the trades chart in a separate window
         open_chart_btn = QPushButton("Open Trades Chart")
-        open_chart_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #0066cc;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #0088ff;
-            }
-        """
-        )
+        open_chart_btn.setObjectName("openTradesChart")
 
         # Auto-detect indicator columns from the ohlc_df
         indicators = []
         if ohlc_data is not None and not ohlc_data.empty:
-            standard_cols = {"open", "high", "low", "close", "volume", "time"}
-            indicator_cols = [
-                col for col in ohlc_data.columns if col.lower() not in standard_cols
-            ]
+            standard_cols = ("open", "high", "low", "close", "volume", "time")
+            columns = ohlc_data.columns
+            indicator_cols = columns[~columns.str.lower().isin(standard_cols)]
 
             # Define a cycle of colors for the indicators
             plot_colors = ["#00FFFF", "#FF00FF", "#FFFF00", "#FFA500", "#DA70D6"]
 
-            for i, col_name in enumerate(indicator_cols):
-                indicators.append(
-                    IndicatorConfig(
-                        type="line",
-                        y=ohlc_data[col_name],
-                        name=col_name.upper(),
-                        color=plot_colors[i % len(plot_colors)],
-                    )
-                )
-
-        def open_trades_chart():
-            try:
-                import pandas as pd
-                from src.visualizer.windows.plot_trades import (
-                    show_candlestick_with_trades,
-                )
-
-                # Ensure OHLC data has proper datetime index
-                processed_ohlc_data = None
-                if ohlc_data is not None and not ohlc_data.empty:
-                    processed_ohlc_data = ohlc_data.copy()
-
-                    # Check if we have a datetime index
-                    if not isinstance(processed_ohlc_data.index, pd.DatetimeIndex):
-                        # Try to use datetime column if it exists
-                        if 'datetime' in processed_ohlc_data.columns:
-                            # Convert datetime column to proper datetime type first
-                            processed_ohlc_data['datetime'] = pd.to_datetime(processed_ohlc_data['datetime'])
-                            processed_ohlc_data = processed_ohlc_data.set_index('datetime')
-                        elif 'time' in processed_ohlc_data.columns:
-                            # Try 'time' column as well
-                            processed_ohlc_data['time'] = pd.to_datetime(processed_ohlc_data['time'])
-                            processed_ohlc_data = processed_ohlc_data.set_index('time')
-                        else:
-                            # Create a dummy datetime index if none exists
-                            processed_ohlc_data.index = pd.date_range(
-                                start='2021-01-01',
-                                periods=len(processed_ohlc_data),
-                                freq='1H',
-                            )
-
-                    # Ensure the index is properly formatted and timezone-naive
-                    if isinstance(processed_ohlc_data.index, pd.DatetimeIndex):
-                        # Remove timezone info if present
-                        if processed_ohlc_data.index.tz is not None:
-                            processed_ohlc_data.index = processed_ohlc_data.index.tz_localize(None)
-                        
-                        # Sort by datetime to ensure proper chronological order
-                        processed_ohlc_data = processed_ohlc_data.sort_index()
-                        
-                        # Ensure numeric 'time' column exists for plotting
-                        if 'time' not in processed_ohlc_data.columns:
-                            processed_ohlc_data['time'] = list(range(len(processed_ohlc_data)))
-
-                window = show_candlestick_with_trades(
-                    ohlc_data=processed_ohlc_data,
-                    trades_df=trades_df,
-                    indicators=indicators,
-                    title="Trades Chart",
-                    block=False,
+            indicators = [
+                IndicatorConfig(
+                    type="line",
+                    y=ohlc_data[col_name],
+                    name=col_name.upper(),
+                    color=color,
                 )
-                return window
-
-            except Exception as e:
-                print(f"Error opening trades chart: {e}")
-                import traceback
+                for col_name, color in zip(indicator_cols, cycle(plot_colors))
+            ]
 
-                traceback.print_exc()
-                return None
+        # Data read by the button, released when the widget is discarded
+        self._trades_context = {
+            "ohlc_data": ohlc_data,
+            "trades_df": trades_df,
+            "indicators": indicators,
+        }
 
         # Connect the button
-        open_chart_btn.clicked.connect(open_trades_chart)
+        open_chart_btn.clicked.connect(self._open_trades_chart)
 
         # Add button to layout
         layout.addWidget(open_chart_btn)
@@ -1199,58 +1506,87 @@ class ExecutionMonitorWidget(QWidget):
         info_label = QLabel(
             f"Found {len(trades_df)} trades. Click the button above to open detailed trade visualization with candlestick charts and indicators."
         )
+        info_label.setObjectName("tradesInfo")
         info_label.setAlignment(Qt.AlignCenter)
-        info_label.setStyleSheet("color: #ccc; font-size: 11px; padding: 10px;")
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
 
-        # Add a simple trades summary table
+        # Add a simple trades summary table once the event loop has shown the
+        # button, dropped if the container is discarded before then
+        QTimer.singleShot(
+            0, container, lambda: self._populate_trades_table(trades_df, layout)
+        )
+
+        return container
+
+    @Slot()
+    def _open_trades_chart(self):
+        """Open the trades chart window for the current plot trades widget."""
+        context = self._trades_context
+        if context is None:
+            return
+        ohlc_data = context["ohlc_data"]
+
         try:
-            from PySide6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
-
-            # Create a simple trades summary table
-            trades_table = QTableWidget()
-            trades_table.setRowCount(min(10, len(trades_df)))  # Show max 10 trades
-            trades_table.setColumnCount(6)
-            trades_table.setHorizontalHeaderLabels(
-                ["Type", "Entry Time", "Exit Time", "Entry Price", "Exit Price", "P&L"]
+            # Ensure OHLC data has proper datetime index
+            processed_ohlc_data = None
+            if ohlc_data is not None and not ohlc_data.empty:
+                processed_ohlc_data = ohlc_data.copy()
+
+                # Check if we have a datetime index
+                if not isinstance(processed_ohlc_data.index, pd.DatetimeIndex):
+                    # Try to use datetime column if it exists
+                    if 'datetime' in processed_ohlc_data.columns:
+                        # Convert datetime column to proper datetime type first
+                        processed_ohlc_data['datetime'] = pd.to_datetime(processed_ohlc_data['datetime'])
+                        processed_ohlc_data = processed_ohlc_data.set_index('datetime')
+                    elif 'time' in processed_ohlc_data.columns:
+                        # Try 'time' column as well
+                        processed_ohlc_data['time'] = pd.to_datetime(processed_ohlc_data['time'])
+                        processed_ohlc_data = processed_ohlc_data.set_index('time')
+                    else:
+                        # Create a dummy datetime index if none exists
+                        processed_ohlc_data.index = pd.date_range(
+                            start='2021-01-01',
+                            periods=len(processed_ohlc_data),
+                            freq='1H',
+                        )
+
+                # Ensure the index is properly formatted and timezone-naive
+                if isinstance(processed_ohlc_data.index, pd.DatetimeIndex):
+                    # Remove timezone info if present
+                    if processed_ohlc_data.index.tz is not None:
+                        processed_ohlc_data.index = processed_ohlc_data.index.tz_localize(None)
+                    
+                    # Sort by datetime to ensure proper chronological order
+                    processed_ohlc_data = processed_ohlc_data.sort_index()
+                    
+                    # Ensure numeric 'time' column exists for plotting
+                    if 'time' not in processed_ohlc_data.columns:
+                        processed_ohlc_data['time'] = list(range(len(processed_ohlc_data)))
+
+            # Keep the window alive while it is open
+            self._trades_chart_window = show_candlestick_with_trades(
+                ohlc_data=processed_ohlc_data,
+                trades_df=context["trades_df"],
+                indicators=context["indicators"],
+                title="Trades Chart",
+                block=False,
             )
 
-            # Style the table
-            from ..theme import theme
-            trades_table.setStyleSheet(theme.get_table_stylesheet())
-
-            # Fill the table with trade data
-            for i, (idx, trade) in enumerate(trades_df.head(10).iterrows()):
-                trades_table.setItem(
-                    i, 0, QTableWidgetItem(str(trade.get('type', 'N/A')))
-                )
-                trades_table.setItem(
-                    i, 1, QTableWidgetItem(str(trade.get('start', 'N/A')))
-                )
-                trades_table.setItem(
-                    i, 2, QTableWidgetItem(str(trade.get('end', 'N/A')))
-                )
-                trades_table.setItem(
-                    i, 3, QTableWidgetItem(f"{trade.get('buyprice', 0):.4f}")
-                )
-                trades_table.setItem(
-                    i, 4, QTableWidgetItem(f"{trade.get('sellprice', 0):.4f}")
-                )
+        except Exception as e:
+            print(f"Error opening trades chart: {e}")
+            traceback.print_exc()
 
-                # Calculate P&L
-                pnl = trade.get('profit', 0)
-                if pnl == 0:
-                    pnl = trade.get('sellprice', 0) - trade.get('buyprice', 0)
+    def _populate_trades_table(self, trades_df, layout: QVBoxLayout):
+        """Add the trades summary table below the plot trades controls."""
+        try:
+            # Create a simple trades summary table, reading cells from a model
+            trades_table = QTableView()
+            trades_table.setModel(TradesTableModel(trades_df, parent=trades_table))
 
-                pnl_item = QTableWidgetItem(f"{pnl:.2f}")
-                if pnl > 0:
-                    from PySide6.QtGui import QColor
-                    pnl_item.setForeground(QColor("#00ff00"))
-                elif pnl < 0:
-                    from PySide6.QtGui import QColor
-                    pnl_item.setForeground(QColor("#ff0000"))
-                trades_table.setItem(i, 5, pnl_item)
+            # Style the table
+            trades_table.setStyleSheet(ExecutionMonitorWidget._trades_table_style())
 
             # Adjust column widths
             trades_table.horizontalHeader().setStretchLastSection(True)
@@ -1260,5 +1596,3 @@ class ExecutionMonitorWidget(QWidget):
 
         except Exception as e:
             print(f"Error creating trades table: {e}")
-
-        return container
@@ -615,12 +615,20 @@ class StrategyBuilderWidget(QWidget):
 
     def _refresh_signal_table(self):
         """Refresh the signal table from the model."""
-        self.signal_table.clear_signals()
-
+        table = self.signal_table
         strategy_config = self.strategy_model.get_strategy_config()
-        if strategy_config and strategy_config.signals:
-            for signal_config in strategy_config.signals:
-                self.signal_table.add_signal_row(signal_config)
+
+        # Rebuild in one pass without repainting or cell-change signals per row
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.clear_signals()
+            if strategy_config and strategy_config.signals:
+                for signal_config in strategy_config.signals:
+                    table.add_signal_row(signal_config)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
 
         # Update move buttons
         self._update_move_buttons()
@@ -51,6 +51,15 @@ class MarketData(ABC):
     def load_data(self) -> Optional[pd.DataFrame]:
         pass
 
+    def to_frame(self) -> Optional[pd.DataFrame]:
+        '''
+        Return the DataFrame held by this market data object.
+
+        :return: pd.DataFrame or None. The `df` attribute when set, otherwise `data`.
+        '''
+        df = getattr(self, 'df', None)
+        return df if df is not None else self.data
+
     @staticmethod
     def connect_to_mt5(attempts: int = 3, wait: int = 2) -> bool:
         '''
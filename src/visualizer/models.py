@@ -2,10 +2,77 @@ from __future__ import annotations
 
 import pandas as pd
 import numpy as np
-from typing import Any, Optional, Dict, Mapping
+from typing import Any, Optional, Dict, List, Sequence, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import accumulate
 import math
 
+# KPI groups shown in results panels: (group title, ((label, result key), ...))
+KPI_SPEC = (
+    (
+        "P&L",
+        (
+            ("Net Balance", "net_balance (BRL)"),
+            ("Gross Balance", "gross_balance (BRL)"),
+            ("Total Profit", "total_profit (BRL)"),
+            ("Total Loss", "total_loss (BRL)"),
+            ("Total Tax", "total_tax (BRL)"),
+            ("Total Cost", "total_cost (BRL)"),
+        ),
+    ),
+    (
+        "Performance",
+        (
+            ("Profit Factor", "profit_factor"),
+            ("Accuracy", "accuracy (%)"),
+            ("Mean Profit", "mean_profit (BRL)"),
+            ("Mean Loss", "mean_loss (BRL)"),
+            ("Mean Ratio", "mean_ratio"),
+            ("Std Deviation", "standard_deviation"),
+        ),
+    ),
+    (
+        "Trades",
+        (
+            ("Total Trades", "total_trades"),
+            ("Positive Trades", "positive_trades"),
+            ("Negative Trades", "negative_trades"),
+        ),
+    ),
+    (
+        "Risk",
+        (
+            ("Max Drawdown", "maximum_drawdown (BRL)"),
+            ("Drawdown %", "drawdown_relative (%)"),
+            ("Final Drawdown %", "drawdown_final (%)"),
+        ),
+    ),
+    (
+        "Period",
+        (
+            ("Start Date", "start_date"),
+            ("End Date", "end_date"),
+            ("Duration", "duration"),
+            ("Avg Monthly", "average_monthly_result (BRL)"),
+        ),
+    ),
+)
+
+
+# KPI_SPEC flattened into parallel label/key arrays, with each group's slice
+_KPI_LABELS = tuple(label for _, spec in KPI_SPEC for label, _ in spec)
+_KPI_KEYS = tuple(key for _, spec in KPI_SPEC for _, key in spec)
+_KPI_GROUPS = tuple(
+    (title, start, start + len(spec))
+    for (title, spec), start in zip(
+        KPI_SPEC, accumulate((len(spec) for _, spec in KPI_SPEC), initial=0)
+    )
+)
+
+# Formatted KPI values treated as missing and left out of the groups
+_EMPTY_KPI_VALUES = frozenset({None, "—", "", "N/A"})
+
 
 class BacktestResultModel:
     """
@@ -52,6 +119,7 @@ class BacktestResultModel:
         self._balance: Optional[pd.Series] = None
         self._drawdown: Optional[pd.Series] = None
         self._monthly_df: Optional[pd.DataFrame] = None
+        self._kpi_groups: Optional[List[Tuple[str, List[Tuple[str, str]]]]] = None
 
     def _extract_result_from_registry(self, registry: Any) -> Dict[str, Any]:
         """Extract result dict from registry instance."""
@@ -146,6 +214,13 @@ class BacktestResultModel:
             self._monthly_df = self._compute_monthly_results()
         return self._monthly_df
 
+    @property
+    def kpi_groups(self) -> List[Tuple[str, List[Tuple[str, str]]]]:
+        """Get the formatted KPI groups, without empty values or groups."""
+        if self._kpi_groups is None:
+            self._kpi_groups = self._compute_kpi_groups()
+        return self._kpi_groups
+
     def _compute_balance_series(self) -> Optional[pd.Series]:
         """Compute cumulative balance from trades."""
         if self._trades_df is None or self._trades_df.empty:
@@ -259,6 +334,24 @@ class BacktestResultModel:
         except Exception:
             return None
 
+    def _compute_kpi_groups(self) -> List[Tuple[str, List[Tuple[str, str]]]]:
+        """Format the KPI_SPEC values of the result dict."""
+        values = self.format_values(_KPI_KEYS)
+
+        def non_empty(start: int, end: int) -> List[Tuple[str, str]]:
+            return [
+                (label, value)
+                for label, value in zip(_KPI_LABELS[start:end], values[start:end])
+                if value not in _EMPTY_KPI_VALUES
+            ]
+
+        # Groups left without KPIs are dropped in the same pass
+        return [
+            (title, kpis)
+            for title, start, end in _KPI_GROUPS
+            if (kpis := non_empty(start, end))
+        ]
+
     def format_value(self, key: str, value: Any) -> str:
         """Format a value for display based on its key and type."""
         if value is None or (
@@ -266,12 +359,10 @@ class BacktestResultModel:
         ):
             return "—"
 
+        kind = _value_kind(key)
         try:
             # Currency values
-            if any(
-                term in key.lower()
-                for term in ['balance', 'profit', 'loss', 'cost', 'tax', 'drawdown']
-            ):
+            if kind == 'currency':
                 if isinstance(value, (int, float)):
                     return f"{value:,.2f}"
                 elif isinstance(value, str) and 'BRL' in value:
@@ -280,11 +371,7 @@ class BacktestResultModel:
                     return f"{float(value):,.2f}"
 
             # Percentage values
-            elif (
-                'accuracy' in key.lower()
-                or 'drawdown_relative' in key.lower()
-                or 'drawdown_final' in key.lower()
-            ):
+            elif kind == 'percentage':
                 if isinstance(value, (int, float)):
                     return f"{value:.2f}%"
                 elif isinstance(value, str) and '%' in value:
@@ -293,14 +380,14 @@ class BacktestResultModel:
                     return f"{float(value):.2f}%"
 
             # Ratio values
-            elif any(term in key.lower() for term in ['factor', 'ratio']):
+            elif kind == 'ratio':
                 if isinstance(value, (int, float)):
                     return f"{value:.3f}"
                 else:
                     return f"{float(value):.3f}"
 
             # Date values
-            elif any(term in key.lower() for term in ['date', 'start', 'end']):
+            elif kind == 'date':
                 if isinstance(value, datetime):
                     return value.strftime("%Y-%m-%d %H:%M:%S")
                 elif isinstance(value, str):
@@ -313,14 +400,11 @@ class BacktestResultModel:
                     return str(value)
 
             # Integer values (trades counts)
-            elif any(
-                term in key.lower()
-                for term in ['trades', 'total', 'positive', 'negative']
-            ):
+            elif kind == 'count':
                 return str(int(float(value)))
 
             # Duration
-            elif 'duration' in key.lower():
+            elif kind == 'duration':
                 if isinstance(value, (int, float)):
                     return f"{int(value)} days"
                 else:
@@ -336,6 +420,33 @@ class BacktestResultModel:
         except (ValueError, TypeError):
             return str(value) if value is not None else "—"
 
+    def format_values(self, keys: Sequence[str]) -> List[str]:
+        """Format the values of several keys of this model's result."""
+        get = self._result.get
+        format_value = self.format_value
+        return [format_value(key, get(key)) for key in keys]
+
+
+@lru_cache(maxsize=None)
+def _value_kind(key: str) -> str:
+    """Classify a result key into the formatting branch used by format_value."""
+    key = key.lower()
+    if any(
+        term in key for term in ['balance', 'profit', 'loss', 'cost', 'tax', 'drawdown']
+    ):
+        return 'currency'
+    elif 'accuracy' in key or 'drawdown_relative' in key or 'drawdown_final' in key:
+        return 'percentage'
+    elif any(term in key for term in ['factor', 'ratio']):
+        return 'ratio'
+    elif any(term in key for term in ['date', 'start', 'end']):
+        return 'date'
+    elif any(term in key for term in ['trades', 'total', 'positive', 'negative']):
+        return 'count'
+    elif 'duration' in key:
+        return 'duration'
+    return 'default'
+
 
 def compute_balance_series(
     trades_df: pd.DataFrame, initial_balance: float = 0
@@ -165,6 +165,11 @@ class MiniChartWidget(QWidget):
         self.plot_widget.setLabel('left', '')
         self.plot_widget.setLabel('bottom', '')
 
+        # Draw about one min/max pair per pixel of the visible range only
+        self.plot_widget.setDownsampling(auto=True, mode='peak')
+        self.plot_widget.setClipToView(True)
+        self._curve = None
+
         # Style the plot
         self.plot_widget.getAxis('left').setPen(pg.mkPen(color='#888', width=1))
         self.plot_widget.getAxis('bottom').setPen(pg.mkPen(color='#888', width=1))
@@ -182,31 +187,33 @@ class MiniChartWidget(QWidget):
             return
 
         try:
-            x = range(len(data))
             y = data.values
 
-            # Remove NaN and infinite values
+            # Remove NaN and infinite values here so pyqtgraph can skip its own check
             valid_mask = ~(pd.isna(y) | np.isinf(y))
             if not valid_mask.any():
                 return
 
-            x_clean = [x[i] for i in range(len(x)) if valid_mask[i]]
+            x_clean = np.flatnonzero(valid_mask)
             y_clean = y[valid_mask]
 
             if fill and 'drawdown' in self.title.lower():
                 # Fill area for drawdown
-                self.plot_widget.plot(
-                    x_clean,
-                    y_clean,
-                    pen=pg.mkPen(color=color, width=2),
-                    fillLevel=0,
-                    brush=pg.mkBrush(color=color + '40'),
-                )
+                fill_opts = dict(fillLevel=0, brush=pg.mkBrush(color=color + '40'))
             else:
                 # Regular line plot
-                self.plot_widget.plot(
-                    x_clean, y_clean, pen=pg.mkPen(color=color, width=2)
-                )
+                fill_opts = dict(fillLevel=None, brush=None)
+
+            # Replot by swapping the data of one persistent curve item
+            if self._curve is None:
+                self._curve = self.plot_widget.plot()
+            self._curve.setData(
+                x_clean,
+                y_clean,
+                pen=pg.mkPen(color=color, width=2),
+                skipFiniteCheck=True,
+                **fill_opts,
+            )
 
         except Exception as e:
             print(f"Error plotting {self.title}: {e}")
@@ -267,20 +274,25 @@ class MonthlyResultsWidget(QWidget):
             return
 
         try:
+            table = self.table
+            columns = [str(column) for column in monthly_df.columns]
+            row_count = len(monthly_df)
+
             # Set up table
-            self.table.setRowCount(len(monthly_df))
-            self.table.setColumnCount(len(monthly_df.columns))
-            self.table.setHorizontalHeaderLabels(monthly_df.columns)
+            table.setRowCount(row_count)
+            table.setColumnCount(len(columns))
+            table.setHorizontalHeaderLabels(columns)
+
+            money_columns = [
+                'balance' in column or 'result' in column for column in columns
+            ]
 
             # Fill data
-            for i, row in monthly_df.iterrows():
+            for i, (_, row) in enumerate(monthly_df.iterrows()):
                 for j, value in enumerate(row):
                     # Format values
                     if isinstance(value, float):
-                        if (
-                            'balance' in monthly_df.columns[j]
-                            or 'result' in monthly_df.columns[j]
-                        ):
+                        if money_columns[j]:
                             formatted_value = f"{value:,.2f}"
                         else:
                             formatted_value = f"{value:.2f}"
@@ -289,11 +301,11 @@ class MonthlyResultsWidget(QWidget):
 
                     item = QTableWidgetItem(formatted_value)
                     item.setTextAlignment(Qt.AlignCenter)
-                    self.table.setItem(i, j, item)
+                    table.setItem(i, j, item)
 
             # Adjust column widths
-            self.table.horizontalHeader().setStretchLastSection(True)
-            self.table.resizeColumnsToContents()
+            table.horizontalHeader().setStretchLastSection(True)
+            table.resizeColumnsToContents()
 
         except Exception as e:
             print(f"Error setting monthly data: {e}")
@@ -450,174 +462,7 @@ class BacktestSummaryWindow(QMainWindow):
 
     def _get_kpi_groups(self) -> List[Tuple[str, List[Tuple[str, str]]]]:
         """Get organized KPI groups with formatted values."""
-        result = self.model.result
-
-        groups = [
-            (
-                "P&L",
-                [
-                    (
-                        "Net Balance",
-                        self.model.format_value(
-                            "net_balance (BRL)", result.get("net_balance (BRL)")
-                        ),
-                    ),
-                    (
-                        "Gross Balance",
-                        self.model.format_value(
-                            "gross_balance (BRL)", result.get("gross_balance (BRL)")
-                        ),
-                    ),
-                    (
-                        "Total Profit",
-                        self.model.format_value(
-                            "total_profit (BRL)", result.get("total_profit (BRL)")
-                        ),
-                    ),
-                    (
-                        "Total Loss",
-                        self.model.format_value(
-                            "total_loss (BRL)", result.get("total_loss (BRL)")
-                        ),
-                    ),
-                    (
-                        "Total Tax",
-                        self.model.format_value(
-                            "total_tax (BRL)", result.get("total_tax (BRL)")
-                        ),
-                    ),
-                    (
-                        "Total Cost",
-                        self.model.format_value(
-                            "total_cost (BRL)", result.get("total_cost (BRL)")
-                        ),
-                    ),
-                ],
-            ),
-            (
-                "Performance",
-                [
-                    (
-                        "Profit Factor",
-                        self.model.format_value(
-                            "profit_factor", result.get("profit_factor")
-                        ),
-                    ),
-                    (
-                        "Accuracy",
-                        self.model.format_value(
-                            "accuracy (%)", result.get("accuracy (%)")
-                        ),
-                    ),
-                    (
-                        "Mean Profit",
-                        self.model.format_value(
-                            "mean_profit (BRL)", result.get("mean_profit (BRL)")
-                        ),
-                    ),
-                    (
-                        "Mean Loss",
-                        self.model.format_value(
-                            "mean_loss (BRL)", result.get("mean_loss (BRL)")
-                        ),
-                    ),
-                    (
-                        "Mean Ratio",
-                        self.model.format_value("mean_ratio", result.get("mean_ratio")),
-                    ),
-                    (
-                        "Std Deviation",
-                        self.model.format_value(
-                            "standard_deviation", result.get("standard_deviation")
-                        ),
-                    ),
-                ],
-            ),
-            (
-                "Trades",
-                [
-                    (
-                        "Total Trades",
-                        self.model.format_value(
-                            "total_trades", result.get("total_trades")
-                        ),
-                    ),
-                    (
-                        "Positive Trades",
-                        self.model.format_value(
-                            "positive_trades", result.get("positive_trades")
-                        ),
-                    ),
-                    (
-                        "Negative Trades",
-                        self.model.format_value(
-                            "negative_trades", result.get("negative_trades")
-                        ),
-                    ),
-                ],
-            ),
-            (
-                "Risk",
-                [
-                    (
-                        "Max Drawdown",
-                        self.model.format_value(
-                            "maximum_drawdown (BRL)",
-                            result.get("maximum_drawdown (BRL)"),
-                        ),
-                    ),
-                    (
-                        "Drawdown %",
-                        self.model.format_value(
-                            "drawdown_relative (%)", result.get("drawdown_relative (%)")
-                        ),
-                    ),
-                    (
-                        "Final Drawdown %",
-                        self.model.format_value(
-                            "drawdown_final (%)", result.get("drawdown_final (%)")
-                        ),
-                    ),
-                ],
-            ),
-            (
-                "Period",
-                [
-                    (
-                        "Start Date",
-                        self.model.format_value("start_date", result.get("start_date")),
-                    ),
-                    (
-                        "End Date",
-                        self.model.format_value("end_date", result.get("end_date")),
-                    ),
-                    (
-                        "Duration",
-                        self.model.format_value("duration", result.get("duration")),
-                    ),
-                    (
-                        "Avg Monthly",
-                        self.model.format_value(
-                            "average_monthly_result (BRL)",
-                            result.get("average_monthly_result (BRL)"),
-                        ),
-                    ),
-                ],
-            ),
-        ]
-
-        # Filter out groups with all None/empty values
-        filtered_groups = []
-        for group_title, kpis in groups:
-            valid_kpis = [
-                (label, value)
-                for label, value in kpis
-                if value != "—" and value is not None
-            ]
-            if valid_kpis:
-                filtered_groups.append((group_title, valid_kpis))
-
-        return filtered_groups
+        return self.model.kpi_groups
 
     def _populate_data(self):
         """Populate the charts with data."""
@@ -739,43 +584,48 @@ def _format_value(v: Any) -> str:
     return f"{v}"
 
 
+# Result keys shown first, in order, by the legacy summary text
+_PREFERRED_RESULT_KEYS = (
+    "net_balance (BRL)",
+    "gross_balance (BRL)",
+    "total_tax (BRL)",
+    "total_cost (BRL)",
+    "total_profit (BRL)",
+    "total_loss (BRL)",
+    "profit_factor",
+    "accuracy (%)",
+    "mean_profit (BRL)",
+    "mean_loss (BRL)",
+    "mean_ratio",
+    "standard_deviation",
+    "total_trades",
+    "positive_trades",
+    "negative_trades",
+    "maximum_drawdown (BRL)",
+    "drawdown_relative (%)",
+    "drawdown_final (%)",
+    "start_date",
+    "end_date",
+    "duration",
+    "average_monthly_result (BRL)",
+)
+_PREFERRED_RESULT_KEY_SET = frozenset(_PREFERRED_RESULT_KEYS)
+
+
 def _format_results_text(results_dict: Mapping[str, Any]) -> str:
     """Returns a text block similar to console output."""
-    preferred_order = [
-        "net_balance (BRL)",
-        "gross_balance (BRL)",
-        "total_tax (BRL)",
-        "total_cost (BRL)",
-        "total_profit (BRL)",
-        "total_loss (BRL)",
-        "profit_factor",
-        "accuracy (%)",
-        "mean_profit (BRL)",
-        "mean_loss (BRL)",
-        "mean_ratio",
-        "standard_deviation",
-        "total_trades",
-        "positive_trades",
-        "negative_trades",
-        "maximum_drawdown (BRL)",
-        "drawdown_relative (%)",
-        "drawdown_final (%)",
-        "start_date",
-        "end_date",
-        "duration",
-        "average_monthly_result (BRL)",
-    ]
-
     keys_available = {str(k): k for k in results_dict.keys()}
 
     lines = ["--- Results ---"]
-    for label in preferred_order:
+    for label in _PREFERRED_RESULT_KEYS:
         if label in keys_available:
             orig_key = keys_available[label]
             val = results_dict.get(orig_key)
             lines.append(f"{label:40s} { _format_value(val) }")
 
-    extra_keys = [k for k in results_dict.keys() if str(k) not in preferred_order]
+    extra_keys = [
+        k for k in results_dict.keys() if str(k) not in _PREFERRED_RESULT_KEY_SET
+    ]
     if extra_keys:
         lines.append("")
         for k in sorted(extra_keys, key=lambda x: str(x)):
@@ -0,0 +1 @@
+# Backtester GUI test package
@@ -0,0 +1,20 @@
+"""
+Shared fixtures for the backtester GUI tests.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+# Run without a display (CI, headless development machines)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """The QApplication shared by every GUI test."""
+    return QApplication.instance() or QApplication([])
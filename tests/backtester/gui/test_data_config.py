@@ -0,0 +1,160 @@
+"""
+Tests for the backtester GUI data configuration module.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtester.gui.models.backtest_model import DataSourceConfig
+from src.backtester.gui.widgets.data_config import (
+    DataFrameTableModel,
+    _count_missing,
+    _count_missing_per_column,
+    _detect_data_type,
+    _wrap_dataframe,
+)
+from src.data import CandleData, TickData
+
+pytestmark = pytest.mark.gui
+
+
+@pytest.fixture
+def config():
+    """A minimal CSV data source configuration."""
+    return DataSourceConfig(source_type="csv", symbol="TEST", timeframe="5min")
+
+
+class TestDataFrameTableModel:
+    """Test the chunked DataFrame preview model."""
+
+    def test_first_chunk_only_until_fetch_more(self):
+        """Only FETCH_ROWS rows are formatted until fetchMore is called."""
+        rows = DataFrameTableModel.FETCH_ROWS * 2
+        model = DataFrameTableModel()
+        model.set_frame(pd.DataFrame({"a": range(rows), "b": range(rows)}))
+
+        assert model.rowCount() == DataFrameTableModel.FETCH_ROWS
+        assert model.columnCount() == 2
+        assert model.canFetchMore()
+
+        model.fetchMore()
+
+        assert model.rowCount() == rows
+        assert not model.canFetchMore()
+
+    def test_last_partial_chunk(self):
+        """The last fetch only adds the rows that are left."""
+        rows = DataFrameTableModel.FETCH_ROWS + 7
+        model = DataFrameTableModel()
+        model.set_frame(pd.DataFrame({"a": range(rows)}))
+
+        model.fetchMore()
+
+        assert model.rowCount() == rows
+        assert model.data(model.index(rows - 1, 0)) == str(rows - 1)
+        assert not model.canFetchMore()
+
+        # Fetching past the end is a no-op
+        model.fetchMore()
+        assert model.rowCount() == rows
+
+    def test_empty_frame(self):
+        """An empty frame shows its headers and no rows."""
+        model = DataFrameTableModel()
+        model.set_frame(pd.DataFrame({"a": [], "b": []}))
+
+        assert model.rowCount() == 0
+        assert model.columnCount() == 2
+        assert not model.canFetchMore()
+
+    def test_no_frame(self):
+        """set_frame(None) clears the model."""
+        model = DataFrameTableModel()
+        model.set_frame(pd.DataFrame({"a": [1, 2]}))
+        model.set_frame(None)
+
+        assert model.rowCount() == 0
+        assert model.columnCount() == 0
+        assert not model.canFetchMore()
+
+
+class TestCountMissing:
+    """Test the missing value counters."""
+
+    def test_total_and_per_column(self):
+        """Missing values are counted across mixed dtypes."""
+        df = pd.DataFrame(
+            {
+                "price": [1.0, np.nan, 3.0, np.nan],
+                "label": ["a", None, "c", "d"],
+                "volume": [1, 2, 3, 4],
+            }
+        )
+
+        assert _count_missing(df) == 3
+        np.testing.assert_array_equal(_count_missing_per_column(df), [2, 1, 0])
+
+    def test_recount_after_rows_added(self):
+        """The memoized total is recomputed when the frame gains rows."""
+        df = pd.DataFrame({"price": [1.0, np.nan]})
+        assert _count_missing(df) == 1
+
+        df.loc[2] = [np.nan]
+
+        assert _count_missing(df) == 2
+
+    def test_empty_frame(self):
+        """An empty frame has nothing missing."""
+        df = pd.DataFrame({"price": pd.Series([], dtype=float)})
+
+        assert _count_missing(df) == 0
+        np.testing.assert_array_equal(_count_missing_per_column(df), [0])
+
+
+class TestWrapDataFrame:
+    """Test wrapping loaded frames in data objects."""
+
+    def test_ohlc_frame_is_candle_data(self, sample_ohlcv_data, config):
+        """Frames with OHLC columns become CandleData."""
+        data = _wrap_dataframe(sample_ohlcv_data.copy(), config)
+
+        assert isinstance(data, CandleData)
+        assert data.symbol == "TEST"
+        assert data.timeframe == "5min"
+
+    def test_ohlc_columns_are_case_insensitive(self, sample_ohlcv_data, config):
+        """Capitalized OHLC columns are still recognized."""
+        df = sample_ohlcv_data.rename(columns=str.capitalize)
+
+        assert isinstance(_wrap_dataframe(df, config), CandleData)
+
+    def test_other_frame_is_tick_data(self, config):
+        """Frames without OHLC columns become TickData."""
+        df = pd.DataFrame({"last": [1.0, 2.0], "volume": [10, 20]})
+
+        data = _wrap_dataframe(df, config)
+
+        assert isinstance(data, TickData)
+        assert data.symbol == "TEST"
+
+
+class TestDetectDataType:
+    """Test the loaded data type detection."""
+
+    def test_data_objects(self, sample_ohlcv_data, config):
+        """CandleData and TickData are classified by type."""
+        candles = _wrap_dataframe(sample_ohlcv_data.copy(), config)
+        ticks = _wrap_dataframe(pd.DataFrame({"last": [1.0]}), config)
+
+        assert _detect_data_type(candles) == "candle"
+        assert _detect_data_type(ticks) == "tick"
+
+    def test_frames(self, sample_ohlcv_data):
+        """Plain frames are classified by their columns."""
+        assert _detect_data_type(sample_ohlcv_data) == "candle"
+        assert _detect_data_type(pd.DataFrame({"last": [1.0]})) == "tick"
+
+    def test_unknown(self):
+        """Objects without columns are unknown."""
+        assert _detect_data_type([1, 2, 3]) == "unknown"
@@ -0,0 +1,133 @@
+"""
+Tests for the backtester GUI execution controller export helpers.
+"""
+
+import datetime
+import json
+import zipfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtester.gui.controllers import execution_controller
+from src.backtester.gui.controllers.execution_controller import (
+    _write_results,
+    _xlsx_cell,
+)
+
+pytestmark = pytest.mark.gui
+
+
+@pytest.fixture
+def trades():
+    """A small trades frame with a missing value and a timestamp column."""
+    return pd.DataFrame(
+        {
+            'type': ['buy', 'sell'],
+            'start': pd.to_datetime(['2024-01-02 10:00', '2024-01-02 11:00']),
+            'profit': [12.5, np.nan],
+            'amount': np.array([1, 2], dtype=np.int64),
+        }
+    )
+
+
+class TestXlsxCell:
+    """Test the conversion of trades values to xlsx cell values."""
+
+    def test_timestamps_pass_through(self):
+        """Timestamps are written natively as dates."""
+        value = pd.Timestamp('2024-01-02 10:00')
+
+        assert _xlsx_cell(value) is value
+        assert _xlsx_cell(datetime.date(2024, 1, 2)) == datetime.date(2024, 1, 2)
+
+    @pytest.mark.parametrize('value', [None, np.nan, pd.NaT, pd.NA])
+    def test_missing_values_are_blank(self, value):
+        """Missing values become blank cells."""
+        assert _xlsx_cell(value) is None
+
+    @pytest.mark.parametrize('value', [np.int64(3), np.float64(1.5), True, 7, 2.5])
+    def test_numbers_pass_through(self, value):
+        """Python and numpy numbers are written natively."""
+        assert _xlsx_cell(value) is value
+
+    def test_other_values_become_text(self):
+        """Values xlsxwriter cannot write are exported as text."""
+        assert _xlsx_cell({'a': 1}) == "{'a': 1}"
+        assert _xlsx_cell([1, 2]) == "[1, 2]"
+
+
+class TestWriteResults:
+    """Test writing exported results to disk."""
+
+    def test_csv(self, trades, tmp_path):
+        """CSV export writes the trades frame without its index."""
+        path = tmp_path / 'trades.csv'
+
+        assert _write_results(trades, None, str(path), 'CSV')
+
+        written = pd.read_csv(path)
+        assert list(written.columns) == list(trades.columns)
+        assert written['profit'].iloc[0] == 12.5
+        assert pd.isna(written['profit'].iloc[1])
+
+    def test_json(self, trades, tmp_path):
+        """JSON export writes the summary, stringifying unknown types."""
+        path = tmp_path / 'summary.json'
+        summary = {'total_trades': 2, 'end': pd.Timestamp('2024-01-02 11:00')}
+
+        assert _write_results(trades, summary, str(path), 'json')
+
+        assert json.loads(path.read_text()) == {
+            'total_trades': 2,
+            'end': '2024-01-02 11:00:00',
+        }
+
+    def test_unknown_format(self, trades, tmp_path):
+        """Unknown formats are rejected without writing anything."""
+        path = tmp_path / 'trades.txt'
+
+        assert not _write_results(trades, None, str(path), 'txt')
+        assert not path.exists()
+
+    def test_xlsx_without_xlsxwriter(self, trades, tmp_path, monkeypatch):
+        """Excel export fails cleanly when xlsxwriter is not installed."""
+        monkeypatch.setattr(execution_controller, 'XLSXWRITER_AVAILABLE', False)
+        path = tmp_path / 'trades.xlsx'
+
+        assert not _write_results(trades, None, str(path), 'xlsx')
+        assert not path.exists()
+
+
+class TestWriteResultsXlsx:
+    """Test Excel export (requires xlsxwriter)."""
+
+    @pytest.fixture(autouse=True)
+    def _require_xlsxwriter(self):
+        pytest.importorskip('xlsxwriter')
+
+    def test_workbook_has_trades_sheet(self, trades, tmp_path):
+        """The workbook holds a single Trades sheet with the column headers."""
+        path = tmp_path / 'trades.xlsx'
+
+        assert _write_results(trades, None, str(path), 'xlsx')
+
+        with zipfile.ZipFile(path) as archive:
+            names = archive.namelist()
+            workbook = archive.read('xl/workbook.xml').decode()
+            sheet = archive.read('xl/worksheets/sheet1.xml').decode()
+        assert 'xl/worksheets/sheet2.xml' not in names
+        assert 'name="Trades"' in workbook
+        for column in trades.columns:
+            assert f'<t>{column}</t>' in sheet
+
+    def test_round_trip(self, trades, tmp_path):
+        """The trades read back from the workbook match the exported frame."""
+        pytest.importorskip('openpyxl')
+        path = tmp_path / 'trades.xlsx'
+
+        assert _write_results(trades, None, str(path), 'excel')
+
+        written = pd.read_excel(path, sheet_name='Trades')
+        pd.testing.assert_frame_equal(written, trades, check_dtype=False)
@@ -0,0 +1,182 @@
+"""
+Tests for the backtester GUI execution monitor widgets.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from src.backtester.gui.widgets.execution_monitor import (
+    LogWidget,
+    TradesTableModel,
+    _LOSS_BRUSH,
+    _PROFIT_BRUSH,
+)
+
+pytestmark = pytest.mark.gui
+
+
+def _pump_flush_timer(log: LogWidget, timeout: float = 2.0):
+    """Process events until the log's pending messages have been flushed."""
+    deadline = time.monotonic() + timeout
+    while log._flush_timer.isActive() and time.monotonic() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.005)
+    assert not log._flush_timer.isActive()
+
+
+def _lines(log: LogWidget):
+    """Return the log lines without their timestamps."""
+    text = log.log_text.toPlainText()
+    return [line.split("] ", 1)[1] for line in text.splitlines()]
+
+
+class TestLogWidget:
+    """Test the buffered execution log."""
+
+    @pytest.fixture
+    def log(self, qapp, monkeypatch):
+        """A log widget holding at most five lines."""
+        monkeypatch.setattr(LogWidget, 'MAX_LOG_BLOCKS', 5)
+        return LogWidget()
+
+    def test_messages_are_buffered_until_flush(self, log):
+        """Messages are only shown once the flush timer fires."""
+        log.add_log_message("first")
+        log.add_log_message("second")
+
+        assert log.log_text.toPlainText() == ""
+
+        _pump_flush_timer(log)
+
+        assert _lines(log) == ["first", "second"]
+
+    def test_oldest_pending_messages_are_dropped(self, log):
+        """Only the newest MAX_LOG_BLOCKS messages of a burst are kept."""
+        for i in range(8):
+            log.add_log_message(f"message {i}")
+
+        _pump_flush_timer(log)
+
+        assert _lines(log) == [f"message {i}" for i in range(3, 8)]
+
+    def test_oldest_shown_lines_are_dropped(self, log):
+        """Lines beyond MAX_LOG_BLOCKS are discarded across flushes."""
+        for i in range(5):
+            log.add_log_message(f"message {i}")
+        _pump_flush_timer(log)
+
+        log.add_log_message("message 5")
+        log.add_log_message("message 6")
+        _pump_flush_timer(log)
+
+        assert _lines(log) == [f"message {i}" for i in range(2, 7)]
+
+    def test_long_messages_are_clipped(self, log):
+        """Messages longer than MAX_MESSAGE_CHARS are cut with an ellipsis."""
+        limit = LogWidget.MAX_MESSAGE_CHARS
+        log.add_log_message("x" * (limit + 100))
+        log.add_log_message("y" * limit)
+
+        _pump_flush_timer(log)
+
+        assert _lines(log) == ["x" * limit + "…", "y" * limit]
+
+    def test_clear_discards_pending_messages(self, log):
+        """Clearing the log also drops messages not yet flushed."""
+        log.add_log_message("shown")
+        _pump_flush_timer(log)
+        log.add_log_message("pending")
+
+        log.clear_log()
+        _pump_flush_timer(log)
+
+        assert log.log_text.toPlainText() == ""
+
+
+def _rows(model: TradesTableModel):
+    """Return the display text of every cell, row by row."""
+    return [
+        [model.data(model.index(row, col)) for col in range(model.columnCount())]
+        for row in range(model.rowCount())
+    ]
+
+
+@pytest.fixture
+def trades_df():
+    """Twelve trades; the second has no recorded profit."""
+    start = pd.date_range('2024-01-01 10:00', periods=12, freq='D')
+    return pd.DataFrame(
+        {
+            'type': ['buy', 'sell'] * 6,
+            'start': start,
+            'end': start + pd.Timedelta(hours=1),
+            'buyprice': np.full(12, 10.0),
+            'sellprice': np.full(12, 11.5),
+            'profit': [5.0, 0.0] + [-1.0] * 10,
+        }
+    )
+
+
+class TestTradesTableModel:
+    """Test the trades summary table model."""
+
+    def test_only_first_trades_are_shown(self, trades_df):
+        """The model covers the first max_rows trades."""
+        model = TradesTableModel(trades_df)
+
+        assert model.rowCount() == 10
+        assert model.columnCount() == len(TradesTableModel.HEADERS)
+        assert TradesTableModel(trades_df, max_rows=3).rowCount() == 3
+
+    def test_cell_formatting(self, trades_df):
+        """Prices use four decimals and P&L two."""
+        rows = _rows(TradesTableModel(trades_df))
+
+        assert rows[0] == [
+            'buy',
+            '2024-01-01 10:00:00',
+            '2024-01-01 11:00:00',
+            '10.0000',
+            '11.5000',
+            '5.00',
+        ]
+        assert rows[2][5] == '-1.00'
+
+    def test_pnl_falls_back_to_price_difference(self, trades_df):
+        """Trades without a recorded profit show the price difference."""
+        model = TradesTableModel(trades_df)
+
+        assert _rows(model)[1][5] == '1.50'
+
+    def test_missing_profit_column(self, trades_df):
+        """Without a profit column every P&L is the price difference."""
+        model = TradesTableModel(trades_df.drop(columns=['profit']))
+
+        assert {row[5] for row in _rows(model)} == {'1.50'}
+
+    def test_missing_text_columns(self, trades_df):
+        """Missing type and time columns are shown as N/A."""
+        model = TradesTableModel(trades_df.drop(columns=['type', 'start', 'end']))
+
+        assert _rows(model)[0][:3] == ['N/A', 'N/A', 'N/A']
+
+    def test_pnl_colors(self, trades_df):
+        """Profits are drawn in the profit color and losses in the loss color."""
+        model = TradesTableModel(trades_df)
+        pnl = TradesTableModel.PNL_COLUMN
+
+        assert model.data(model.index(0, pnl), Qt.ForegroundRole) is _PROFIT_BRUSH
+        assert model.data(model.index(2, pnl), Qt.ForegroundRole) is _LOSS_BRUSH
+        assert model.data(model.index(0, 0), Qt.ForegroundRole) is None
+
+    def test_empty_frame(self, trades_df):
+        """A frame without trades gives an empty table."""
+        model = TradesTableModel(trades_df.iloc[:0])
+
+        assert model.rowCount() == 0
+        assert model.columnCount() == len(TradesTableModel.HEADERS)
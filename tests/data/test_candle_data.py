@@ -57,6 +57,14 @@ class TestCandleData:
         assert len(candle_data.df) == 10
         assert list(candle_data.df.columns) == ['open', 'high', 'low', 'close', 'volume']
 
+    def test_to_frame_returns_df(self):
+        """Test that to_frame returns the wrapped DataFrame."""
+        candle_data = CandleData(symbol='TEST', timeframe='60min')
+        data = pd.DataFrame({'open': [1.0], 'close': [2.0]})
+        candle_data.df = data
+
+        assert candle_data.to_frame() is data
+
     def test_candle_data_inheritance(self):
         """Test that CandleData inherits from MarketData."""
         candle_data = CandleData(symbol='TEST', timeframe='60min')
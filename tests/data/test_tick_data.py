@@ -47,6 +47,15 @@ class TestTickData:
         assert len(tick_data.df) == 100
         assert list(tick_data.df.columns) == ['datetime', 'price', 'volume']
 
+    def test_to_frame_falls_back_to_data(self):
+        """Test that to_frame falls back to the base data attribute."""
+        tick_data = TickData(symbol='TEST')
+        data = pd.DataFrame({'price': [1.0, 2.0]})
+        tick_data.df = None
+        tick_data.data = data
+
+        assert tick_data.to_frame() is data
+
     def test_import_from_mt5(self, mock_mt5_connection):
         """Test import_from_mt5 method."""
         # Mock MT5 tick data
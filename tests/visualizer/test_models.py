@@ -25,3 +25,41 @@ class TestVisualizerModels:
         """Test plot configuration and settings models."""
         # Add tests for plot configuration structures
         pass
+
+
+class TestBacktestResultModelKpiGroups:
+    """Test the formatted KPI groups of BacktestResultModel."""
+
+    def test_kpi_groups_drop_empty_values_and_groups(self):
+        """Missing or NaN KPIs are left out, as are groups left without KPIs."""
+        model = BacktestResultModel(
+            result={
+                "net_balance (BRL)": 1234.5,
+                "total_cost (BRL)": float("nan"),
+                "total_trades": 10,
+                "duration": "N/A",
+            }
+        )
+
+        assert model.kpi_groups == [
+            ("P&L", [("Net Balance", "1,234.50")]),
+            ("Trades", [("Total Trades", "10")]),
+        ]
+
+    def test_kpi_groups_are_computed_once(self):
+        """Repeated reads return the cached groups."""
+        model = BacktestResultModel(result={"profit_factor": 1.5})
+
+        assert model.kpi_groups is model.kpi_groups
+
+    def test_format_values_matches_format_value(self):
+        """Batch formatting returns format_value's output for each key, in order."""
+        result = {"net_balance (BRL)": 10.0, "profit_factor": 2, "total_trades": 3.0}
+        model = BacktestResultModel(result=result)
+        keys = ["total_trades", "missing", "profit_factor", "net_balance (BRL)"]
+
+        assert model.format_values(keys) == [
+            model.format_value(key, result.get(key)) for key in keys
+        ]
+        other = BacktestResultModel(result={"total_trades": 7})
+        assert other.format_values(["total_trades"]) == ["7"]